@@ -34,9 +34,9 @@ def read_toml_file(file_path: Path) -> Dict[str, Any]:
         if not file_path.is_file():
             logger.debug(f"TOML file not found: {file_path}")
             return {}
-        content = file_path.read_text()
-        logger.debug(f"Reading TOML from {file_path}:\n{content}")
-        return tomli.loads(content)
+        logger.debug("Reading TOML from {}", file_path)
+        with open(file_path, "rb") as f:
+            return tomli.load(f)
     except Exception as e:
         logger.debug(f"Failed to read TOML file {file_path}: {e}")
         return {}
@@ -1,9 +1,14 @@
 """Conventional Commit message parsing."""
 
 import re
+import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterator, List, Optional
+
+# Pre-release labels accepted in a [pre-release=...] footer token
+PRERELEASE_LABELS = frozenset({"alpha", "beta", "rc"})
 
 
 class BumpType(str, Enum):
@@ -33,25 +38,32 @@ class CommitType(str, Enum):
     def from_str(cls, value: str) -> "CommitType":
         """Create from string value."""
         try:
-            return cls(value.lower())
-        except ValueError as e:
+            return _COMMIT_TYPE_BY_NAME[value.lower()]
+        except KeyError as e:
             raise ValueError(f"Invalid commit type: {value}") from e
 
 
-@dataclass
+# Direct value -> member lookup, avoiding Enum.__call__ on every parse
+_COMMIT_TYPE_BY_NAME = {commit_type.value: commit_type for commit_type in CommitType}
+
+# Commit types that trigger a version bump on their own
+_TYPE_TO_BUMP = {CommitType.FEAT: BumpType.MINOR, CommitType.FIX: BumpType.PATCH}
+
+
+def _has_breaking_change(text: str) -> bool:
+    """Check for a BREAKING CHANGE (or BREAKING-CHANGE) footer marker."""
+    return "BREAKING CHANGE:" in text or "BREAKING-CHANGE:" in text
+
+
+@dataclass(frozen=True, slots=True)
 class FooterToken:
     """Token parsed from commit footer."""
 
     key: str
     value: Optional[str] = None
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, FooterToken):
-            return NotImplemented
-        return self.key == other.key and self.value == other.value
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConventionalCommit:
     """Parsed conventional commit message."""
 
@@ -70,7 +82,8 @@ class ConventionalCommit:
         r"\s*(?P<description>.+)$"
     )
     FOOTER_PATTERN = re.compile(r"\[(?P<key>[^\]=]+)(?:=(?P<value>[^\]]+))?\]")
-    FIXUP_PATTERN = re.compile(r"^(fixup!|squash!)\s*", re.IGNORECASE)
+    # Leading whitespace is matched in the pattern so the message is never copied
+    FIXUP_PATTERN = re.compile(r"\s*(fixup!|squash!)", re.IGNORECASE)
 
     @staticmethod
     def is_fixup_commit(message: str) -> bool:
@@ -82,7 +95,7 @@ class ConventionalCommit:
         Returns:
             True if the message starts with 'fixup!' or 'squash!'
         """
-        return bool(ConventionalCommit.FIXUP_PATTERN.match(message.strip()))
+        return ConventionalCommit.FIXUP_PATTERN.match(message) is not None
 
     @classmethod
     def parse_with_fixup_handling(cls, message: str) -> Optional["ConventionalCommit"]:
@@ -111,18 +124,25 @@ class ConventionalCommit:
         Returns:
             True if the message is a merge commit
         """
-        first_line = message.strip().split("\n")[0].strip()
-        return (
-            first_line.startswith("Merge ")
-            or first_line.startswith("# Please enter the commit message")
-            or first_line.startswith("# On branch")
-            or first_line == ""
+        return ConventionalCommit._is_merge_header(
+            message.strip().partition("\n")[0].strip()
+        )
+
+    @staticmethod
+    def _is_merge_header(first_line: str) -> bool:
+        """Check if an already stripped first line belongs to a merge commit."""
+        return first_line == "" or first_line.startswith(
+            ("Merge ", "# Please enter the commit message", "# On branch")
         )
 
     @classmethod
+    @lru_cache(maxsize=512)
     def parse(cls, message: str) -> "ConventionalCommit":
         """Parse a conventional commit message.
 
+        Results are cached per message; instances are frozen, so sharing them
+        across callers (e.g. the hooks parsing the same HEAD message) is safe.
+
         Args:
             message: Full commit message to parse
 
@@ -132,40 +152,55 @@ class ConventionalCommit:
         Raises:
             ValueError: If message doesn't match conventional format
         """
+        message = message.strip()
+
+        # For the header, only use the first line (in case of squashed commits)
+        # This handles cases where squashed commits have multiple commit messages
+        first_line = message.partition("\n")[0].strip()
+
         # Check if this is a merge commit or other non-conventional commit
-        if cls.is_merge_commit(message):
+        if cls._is_merge_header(first_line):
             raise ValueError(
                 "Merge commit or non-conventional commit - skipping version bump"
             )
 
-        # Split into parts
-        parts = message.strip().split("\n\n", maxsplit=2)
-        header = parts[0]
-        body = parts[1] if len(parts) > 1 else None
-        footer = parts[2] if len(parts) > 2 else None
-
-        # For the header, only use the first line (in case of squashed commits)
-        # This handles cases where squashed commits have multiple commit messages
-        header_lines = header.split("\n")
-        first_line = header_lines[0].strip()
+        # Split into parts: body up to the second blank line, footer after it
+        body = footer = None
+        if (body_start := message.find("\n\n")) >= 0:
+            body_start += 2
+            if (footer_start := message.find("\n\n", body_start)) >= 0:
+                body = message[body_start:footer_start]
+                footer = message[footer_start + 2 :]
+            else:
+                body = message[body_start:]
 
         # Skip comment lines that start with #
         if first_line.startswith("#") or not first_line:
             raise ValueError("Empty or comment line - skipping version bump")
 
-        if not (match := cls.HEADER_PATTERN.match(first_line)):
-            raise ValueError("Invalid commit header format")
-
-        commit_type = CommitType.from_str(match.group("type"))
-        scope = match.group("scope")
-        breaking = bool(match.group("breaking"))
-        description = match.group("description")
+        # Unscoped, non-breaking headers ("feat: ...") are the common case and
+        # need no regex; anything else goes through HEADER_PATTERN
+        commit_type_name, colon, description = first_line.partition(":")
+        description = description.lstrip()
+        if colon and description and commit_type_name in _COMMIT_TYPE_BY_NAME:
+            commit_type = _COMMIT_TYPE_BY_NAME[commit_type_name]
+            scope = None
+            breaking = False
+        else:
+            if not (match := cls.HEADER_PATTERN.match(first_line)):
+                raise ValueError("Invalid commit header format")
+
+            commit_type = CommitType.from_str(match.group("type"))
+            # Scopes repeat across commits, so share a single string per scope
+            scope = sys.intern(scope) if (scope := match.group("scope")) else None
+            breaking = bool(match.group("breaking"))
+            description = match.group("description")
         # Move BREAKING CHANGE from body to footer if needed
-        if body and "BREAKING CHANGE:" in body:
+        if body and _has_breaking_change(body):
             footer = f"{body}\n\n{footer}" if footer else body
             body = None
             breaking = True
-        elif footer and "BREAKING CHANGE:" in footer:
+        elif footer and _has_breaking_change(footer):
             breaking = True
 
         return cls(
@@ -177,26 +212,24 @@ class ConventionalCommit:
             footer=footer,
         )
 
-    def get_footer_tokens(self) -> List[FooterToken]:
-        """Parse footer section into tokens."""
-        tokens = []
-        for section in [self.body, self.footer]:
+    def iter_footer_tokens(self) -> Iterator[FooterToken]:
+        """Lazily yield tokens from the body and footer sections."""
+        for section in (self.body, self.footer):
             if section:
                 for match in self.FOOTER_PATTERN.finditer(section):
-                    key = match.group("key")
-                    value = match.group("value")
-                    tokens.append(FooterToken(key, value))
-        return tokens
+                    yield FooterToken(match.group("key"), match.group("value"))
+
+    def get_footer_tokens(self) -> List[FooterToken]:
+        """Parse footer section into tokens."""
+        return list(self.iter_footer_tokens())
 
     def get_prerelease_label(self) -> Optional[str]:
         """Extract pre-release label from commit footer."""
         return next(
             (
                 token.value
-                for token in self.get_footer_tokens()
-                if token.key == "pre-release"
-                and token.value
-                and token.value in ["alpha", "beta", "rc"]
+                for token in self.iter_footer_tokens()
+                if token.key == "pre-release" and token.value in PRERELEASE_LABELS
             ),
             None,
         )
@@ -207,12 +240,14 @@ class ConventionalCommit:
         Returns:
             BumpType enum indicating the type of version bump needed
         """
+        tokens = self.get_footer_tokens()
+
         # Check for skip flag
-        if any(token.key == "skip-bump" for token in self.get_footer_tokens()):
+        if any(token.key == "skip-bump" for token in tokens):
             return BumpType.NONE
 
         # Check for force flags
-        for token in self.get_footer_tokens():
+        for token in tokens:
             if token.key == "force-major":
                 return BumpType.MAJOR
             if token.key == "force-minor":
@@ -223,8 +258,4 @@ class ConventionalCommit:
         # Get bump type from commit
         if self.breaking:
             return BumpType.MAJOR
-        elif self.type == CommitType.FEAT:
-            return BumpType.MINOR
-        elif self.type == CommitType.FIX:
-            return BumpType.PATCH
-        return BumpType.NONE
+        return _TYPE_TO_BUMP.get(self.type, BumpType.NONE)
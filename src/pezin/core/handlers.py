@@ -1,16 +1,124 @@
 """File handlers for different version file formats."""
 
+import codecs
 import json
+import mmap
+import os
 import re
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import tomli
 import tomli_w
 
 from .version import Version
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup for JSON version files
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode JSON with two-space indentation, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _atomic_write(
+    file_path: Path,
+    data: Union[str, bytes],
+    encoding: str = "utf-8",
+    newline: Optional[str] = None,
+) -> None:
+    """Write a file through a temporary sibling and os.replace().
+
+    Readers never see a partially written file. Symlinks are followed, and the
+    original file mode is kept.
+
+    Args:
+        file_path: File to replace
+        data: New contents; str is encoded with encoding and newline
+        encoding: Text encoding used for str data
+        newline: Newline translation used for str data (see open())
+    """
+    target = Path(os.path.realpath(file_path))
+    # A unique temporary name never clobbers another file or concurrent writer
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        if isinstance(data, bytes):
+            with open(fd, "wb") as f:
+                f.write(data)
+        else:
+            with open(fd, "w", encoding=encoding, newline=newline) as f:
+                f.write(data)
+        shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Generic files larger than this are searched through mmap instead of read whole
+GENERIC_MMAP_THRESHOLD = 64 * 1024
+
+# Start of the next [table] or [[array]] header when scanning TOML text
+_TOML_TABLE_HEADER_PATTERN = re.compile(r"^[ \t]*\[", re.MULTILINE)
+_TOML_MULTILINE_STRING_PATTERN = re.compile(r"\"\"\"|'''")
+
+
+def _find_toml_table_value(content: str, key: str) -> Optional[re.Match[str]]:
+    """Find a simple `leaf = "value"` line for a dotted key in raw TOML text.
+
+    Only keys written under their own [table] header are recognized; dotted
+    keys and inline tables are left to a real TOML parser. Multi-line strings
+    can hide lines that look like keys or headers, so no match is returned
+    when one appears before the value.
+
+    Args:
+        content: TOML document text
+        key: Dotted key such as "project.version"
+
+    Returns:
+        Match whose third group spans the unquoted value, or None
+    """
+    section, _, leaf = key.rpartition(".")
+    if not section:
+        return None
+
+    header = re.search(
+        rf"^\[[ \t]*{re.escape(section)}[ \t]*\][ \t]*(?:#[^\r\n]*)?\r?$",
+        content,
+        re.MULTILINE,
+    )
+    if not header:
+        return None
+
+    next_header = _TOML_TABLE_HEADER_PATTERN.search(content, header.end())
+    end = next_header.start() if next_header else len(content)
+
+    value_pattern = re.compile(
+        rf"^([ \t]*{re.escape(leaf)}[ \t]*=[ \t]*)([\"'])([^\"'\\\r\n]*)\2"
+        r"[ \t]*(?:#[^\r\n]*)?\r?$",
+        re.MULTILINE,
+    )
+    match = value_pattern.search(content, header.end(), end)
+    if match and _TOML_MULTILINE_STRING_PATTERN.search(content, 0, match.start()):
+        return None
+    return match
+
 
 class FileHandler(ABC):
     """Abstract base class for version file handlers."""
@@ -54,6 +162,8 @@ class TomlFileHandler(FileHandler):
             return None
 
         try:
+            # Parse the whole document rather than scanning for the key line, so
+            # that invalid TOML is rejected here just as write_version() does
             with open(self.file_path, "rb") as f:
                 data = tomli.load(f)
 
@@ -67,14 +177,24 @@ class TomlFileHandler(FileHandler):
 
             return None
 
-        except (tomli.TOMLDecodeError, OSError):
+        except (tomli.TOMLDecodeError, OSError, UnicodeDecodeError):
             return None
 
     def write_version(self, version: Version) -> None:
-        """Write version to TOML file."""
+        """Write version to TOML file.
+
+        When the version key is already known from read_version(), the value is
+        replaced in place in the raw text, preserving comments and formatting.
+        Otherwise the file is round-tripped through tomli/tomli_w.
+        """
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
+        if self._found_key and self._write_version_in_place(
+            self._found_key, str(version)
+        ):
+            return
+
         try:
             with open(self.file_path, "rb") as f:
                 data = tomli.load(f)
@@ -92,8 +212,7 @@ class TomlFileHandler(FileHandler):
             ) from e
 
         try:
-            with open(self.file_path, "wb") as f:
-                tomli_w.dump(data, f)
+            _atomic_write(self.file_path, tomli_w.dumps(data).encode("utf-8"))
         except OSError as e:
             raise ValueError(f"Could not write to file {self.file_path}: {e}") from e
 
@@ -102,6 +221,42 @@ class TomlFileHandler(FileHandler):
         path = Path(file_path)
         return path.suffix in {".toml"} or path.name in {"pyproject.toml", "Pipfile"}
 
+    def _write_version_in_place(self, key: str, value: str) -> bool:
+        """Replace the quoted value of a table key directly in the file text.
+
+        Args:
+            key: Dotted key whose last part lives in a [table] header section
+            value: New version string
+
+        Returns:
+            True if the file was updated, False if the key was not found as a
+            simple `key = "value"` line under its table header or the edited
+            text would not parse to the new value
+        """
+        try:
+            with open(self.file_path, "r", encoding="utf-8", newline="") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            raise ValueError(f"Could not read TOML file {self.file_path}: {e}") from e
+
+        if not (match := _find_toml_table_value(content, key)):
+            return False
+
+        new_content = content[: match.start(3)] + value + content[match.end(3) :]
+        # Only keep the edit if it changed the key a TOML parser would read
+        try:
+            if self._get_nested_value(tomli.loads(new_content), key) != value:
+                return False
+        except (tomli.TOMLDecodeError, KeyError, TypeError):
+            return False
+
+        try:
+            _atomic_write(self.file_path, new_content, newline="")
+        except OSError as e:
+            raise ValueError(f"Could not write to file {self.file_path}: {e}") from e
+
+        return True
+
     def _get_nested_value(self, data: Dict[str, Any], key: str) -> Any:
         """Get nested value from dictionary using dot notation."""
         keys = key.split(".")
@@ -134,8 +289,8 @@ class JsonFileHandler(FileHandler):
             return None
 
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.file_path, "rb") as f:
+                data = _json_loads(f.read())
 
             if version_str := self._get_nested_value(data, self.version_key):
                 return Version(version_str)
@@ -151,8 +306,8 @@ class JsonFileHandler(FileHandler):
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.file_path, "rb") as f:
+                data = _json_loads(f.read())
         except (json.JSONDecodeError, OSError) as e:
             raise ValueError(f"Could not read JSON file {self.file_path}: {e}") from e
 
@@ -164,8 +319,7 @@ class JsonFileHandler(FileHandler):
             ) from e
 
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _atomic_write(self.file_path, _json_dumps(data))
         except OSError as e:
             raise ValueError(f"Could not write to file {self.file_path}: {e}") from e
 
@@ -199,18 +353,30 @@ class GenericFileHandler(FileHandler):
     def __init__(
         self,
         file_path: Union[str, Path],
-        version_pattern: Optional[str] = None,
+        version_pattern: Optional[Union[str, re.Pattern[str]]] = None,
         version_replacement: Optional[str] = None,
         version_format: Optional[str] = None,
         encoding: str = "utf-8",
     ):
         super().__init__(file_path)
         # Use a simple default pattern if none provided
-        self.version_pattern = version_pattern or r'version["\s]*[=:]["\s]*([^\s"\']+)'
+        version_pattern = version_pattern or r'version["\s]*[=:]["\s]*([^\s"\']+)'
+        # Pre-compiled patterns (e.g. from COMMON_PATTERNS) are used as-is
+        if isinstance(version_pattern, re.Pattern):
+            self._compiled_pattern = version_pattern
+        else:
+            self._compiled_pattern = re.compile(version_pattern, re.MULTILINE)
+        self.version_pattern = self._compiled_pattern.pattern
         self.version_replacement = version_replacement or r'version = "{version}"'
         self.version_format = version_format  # New: template for output formatting
         self.encoding = encoding
-        self._compiled_pattern = re.compile(self.version_pattern, re.MULTILINE)
+        # Large files are only searched as bytes when that cannot change what
+        # an ASCII-only pattern matches; _bytes_pattern is compiled lazily
+        self._use_bytes_search = (
+            codecs.lookup(encoding).name == "utf-8" and self.version_pattern.isascii()
+        )
+        self._bytes_pattern: Optional[re.Pattern[bytes]] = None
+        self._cached_content: Optional[Tuple[Tuple[int, int], str]] = None
 
     def read_version(self) -> Optional[Version]:
         """Read version from generic text file using regex.
@@ -222,12 +388,22 @@ class GenericFileHandler(FileHandler):
             return None
 
         try:
-            with open(self.file_path, "r", encoding=self.encoding) as f:
-                content = f.read()
-
-            if match := self._compiled_pattern.search(content):
-                groups = match.groups()
-
+            stat = self.file_path.stat()
+            if (
+                self._use_bytes_search
+                and stat.st_size > GENERIC_MMAP_THRESHOLD
+                and self._compile_bytes_pattern()
+            ):
+                groups = self._search_mapped_file()
+            else:
+                with open(self.file_path, "r", encoding=self.encoding) as f:
+                    content = f.read()
+                # Keep the text for a following write_version() call
+                self._cached_content = (stat.st_mtime_ns, stat.st_size), content
+                match = self._compiled_pattern.search(content)
+                groups = match.groups() if match else None
+
+            if groups is not None:
                 if len(groups) >= 3:
                     # Check if this looks like component parsing (all groups are digits)
                     try:
@@ -270,16 +446,77 @@ class GenericFileHandler(FileHandler):
         except (OSError, re.error):
             return None
 
+    def _compile_bytes_pattern(self) -> bool:
+        """Compile the bytes form of the version pattern used for large files.
+
+        Bytes patterns have ASCII-only semantics: \\s, \\d and \\w match ASCII
+        characters only, and IGNORECASE folds only ASCII letters. Patterns that
+        cannot be compiled as bytes (e.g. using \\u escapes) keep the text path.
+
+        Returns:
+            True if the bytes pattern is available
+        """
+        if self._bytes_pattern is None and self._use_bytes_search:
+            try:
+                self._bytes_pattern = re.compile(
+                    self.version_pattern.encode("ascii"),
+                    self._compiled_pattern.flags & ~re.UNICODE,
+                )
+            except re.error:
+                self._use_bytes_search = False
+        return self._bytes_pattern is not None
+
+    def _search_mapped_file(self) -> Optional[Tuple[Optional[str], ...]]:
+        """Search a large UTF-8 file through mmap without decoding all of it.
+
+        Only called once _compile_bytes_pattern() has succeeded, so matching
+        follows the bytes pattern's ASCII-only semantics.
+
+        Returns:
+            Decoded match groups, or None if the pattern does not match
+        """
+        with (
+            open(self.file_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            match = self._bytes_pattern.search(mapped)
+            if not match:
+                return None
+            # Copy the groups out before the mapping is closed
+            groups = match.groups()
+            del match
+
+        return tuple(
+            group.decode("utf-8") if group is not None else None for group in groups
+        )
+
+    def _take_cached_content(self) -> Optional[str]:
+        """Return the text cached by read_version() if the file is unchanged.
+
+        The cache is consumed, so it is used by at most one write.
+        """
+        if self._cached_content is None:
+            return None
+
+        stat_key, content = self._cached_content
+        self._cached_content = None
+        try:
+            stat = self.file_path.stat()
+        except OSError:
+            return None
+        return content if (stat.st_mtime_ns, stat.st_size) == stat_key else None
+
     def write_version(self, version: Version) -> None:
         """Write version to generic text file using regex replacement."""
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
-        try:
-            with open(self.file_path, "r", encoding=self.encoding) as f:
-                content = f.read()
-        except (OSError, UnicodeDecodeError) as e:
-            raise ValueError(f"Could not read file {self.file_path}: {e}") from e
+        if (content := self._take_cached_content()) is None:
+            try:
+                with open(self.file_path, "r", encoding=self.encoding) as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                raise ValueError(f"Could not read file {self.file_path}: {e}") from e
 
         try:
             # Use template-based replacement with all version components available
@@ -294,8 +531,7 @@ class GenericFileHandler(FileHandler):
             raise ValueError(f"No version pattern found in {self.file_path}")
 
         try:
-            with open(self.file_path, "w", encoding=self.encoding) as f:
-                f.write(new_content)
+            _atomic_write(self.file_path, new_content, encoding=self.encoding)
         except (OSError, UnicodeEncodeError) as e:
             raise ValueError(f"Could not write to file {self.file_path}: {e}") from e
 
@@ -305,6 +541,21 @@ class GenericFileHandler(FileHandler):
         return True
 
 
+# Handler lookup tables used by FileHandlerFactory
+_HANDLERS_BY_TYPE = {
+    "toml": TomlFileHandler,
+    "json": JsonFileHandler,
+    "generic": GenericFileHandler,
+}
+_HANDLERS_BY_NAME = {
+    "pyproject.toml": TomlFileHandler,
+    "Pipfile": TomlFileHandler,
+    "package.json": JsonFileHandler,
+    "composer.json": JsonFileHandler,
+}
+_HANDLERS_BY_SUFFIX = {".toml": TomlFileHandler, ".json": JsonFileHandler}
+
+
 class FileHandlerFactory:
     """Factory for creating appropriate file handlers."""
 
@@ -313,55 +564,48 @@ class FileHandlerFactory:
         file_path: Union[str, Path], file_type: Optional[str] = None, **kwargs
     ) -> FileHandler:
         """Create appropriate handler for the given file."""
-        path = Path(file_path)
-
         if file_type:
-            # Explicit file type specified
-            if file_type.lower() == "toml":
-                return TomlFileHandler(file_path, **kwargs)
-            elif file_type.lower() == "json":
-                return JsonFileHandler(file_path, **kwargs)
-            elif file_type.lower() == "generic":
-                return GenericFileHandler(file_path, **kwargs)
-            else:
-                # Unknown file type, fallback to generic
-                return GenericFileHandler(file_path, **kwargs)
-
-        # Auto-detect based on file extension/name
-        if path.suffix in {".toml"} or path.name in {"pyproject.toml", "Pipfile"}:
-            return TomlFileHandler(file_path, **kwargs)
-        elif path.suffix == ".json" or path.name in {
-            "package.json",
-            "composer.json",
-        }:
-            return JsonFileHandler(file_path, **kwargs)
+            # Explicit file type specified, unknown types fall back to generic
+            handler_class = _HANDLERS_BY_TYPE.get(file_type.lower(), GenericFileHandler)
         else:
-            # Fallback to generic handler
-            return GenericFileHandler(file_path, **kwargs)
+            # Auto-detect based on file name, then extension
+            path = Path(file_path)
+            handler_class = _HANDLERS_BY_NAME.get(path.name) or _HANDLERS_BY_SUFFIX.get(
+                path.suffix, GenericFileHandler
+            )
+
+        return handler_class(file_path, **kwargs)
 
     @staticmethod
     def get_supported_handlers() -> List[str]:
         """Get list of supported handler types."""
-        return ["toml", "json", "generic"]
+        return list(_HANDLERS_BY_TYPE)
 
 
-# Common patterns for different file types
+# Common patterns for different file types, compiled once at import time
 COMMON_PATTERNS = {
     "c_header": {
-        "pattern": r'(#define\s+VERSION\s+["\']?)([^"\']+)(["\']?)',
+        "pattern": re.compile(
+            r'(#define\s+VERSION\s+["\']?)([^"\']+)(["\']?)', re.MULTILINE
+        ),
         "replacement": r"\g<1>{version}\g<3>",
     },
-    "cmake": {"pattern": r"(VERSION\s+)([^\s)]+)", "replacement": r"\g<1>{version}"},
+    "cmake": {
+        "pattern": re.compile(r"(VERSION\s+)([^\s)]+)", re.MULTILINE),
+        "replacement": r"\g<1>{version}",
+    },
     "dockerfile": {
-        "pattern": r'(LABEL\s+version\s*=\s*["\']?)([^"\']+)(["\']?)',
+        "pattern": re.compile(
+            r'(LABEL\s+version\s*=\s*["\']?)([^"\']+)(["\']?)', re.MULTILINE
+        ),
         "replacement": r"\g<1>{version}\g<3>",
     },
     "makefile": {
-        "pattern": r"(VERSION\s*[:=]\s*)([^\s]+)",
+        "pattern": re.compile(r"(VERSION\s*[:=]\s*)([^\s]+)", re.MULTILINE),
         "replacement": r"\g<1>{version}",
     },
     "shell_script": {
-        "pattern": r'(VERSION\s*=\s*["\']?)([^"\']+)(["\']?)',
+        "pattern": re.compile(r'(VERSION\s*=\s*["\']?)([^"\']+)(["\']?)', re.MULTILINE),
         "replacement": r"\g<1>{version}\g<3>",
     },
 }
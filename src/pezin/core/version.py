@@ -20,9 +20,11 @@ Example:
 """
 
 import re
+import string
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -32,6 +34,34 @@ from ..logging import get_logger
 
 logger = get_logger()
 
+# Semantic version core (with optional pre-release and build) inside a string
+VERSION_CORE_PATTERN = re.compile(
+    r"(?:^|[^\d])(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9\-]+))?(?:\+([a-zA-Z0-9\-\.]+))?(?:[^\d]|$)"
+)
+
+# Characters allowed in the pre-release and build parts of VERSION_CORE_PATTERN
+_PRERELEASE_CHARS = frozenset(string.ascii_letters + string.digits + "-")
+_BUILD_CHARS = _PRERELEASE_CHARS | {"."}
+
+
+def _is_plain_semver(version_string: str) -> bool:
+    """Check for a bare X.Y.Z[-pre][+build] string without prefix or suffix.
+
+    Such strings parse the same as through VERSION_CORE_PATTERN, but can be
+    recognized with a few string splits instead of a regex search.
+    """
+    core, plus, build = version_string.partition("+")
+    head, dash, prerelease = core.partition("-")
+    parts = head.split(".")
+    return (
+        len(parts) == 3
+        and all(part.isascii() and part.isdigit() for part in parts)
+        and (
+            not dash or (bool(prerelease) and _PRERELEASE_CHARS.issuperset(prerelease))
+        )
+        and (not plus or (bool(build) and _BUILD_CHARS.issuperset(build)))
+    )
+
 
 class VersionBumpType(str, Enum):
     """Type of version bump following semantic versioning."""
@@ -44,6 +74,8 @@ class VersionBumpType(str, Enum):
 class Version:
     """Semantic version handling with custom formatting support."""
 
+    __slots__ = ("_version", "_original_format", "_str")
+
     def __init__(
         self,
         version_string: Optional[str] = None,
@@ -55,6 +87,8 @@ class Version:
         original_format: Optional[str] = None,
     ):
         """Initialize Version from string or components."""
+        # SemVer rendering, filled in by the first __str__ call
+        self._str: Optional[str] = None
         if version_string is not None:
             # Parse from string (existing behavior)
             self._init_from_string(version_string)
@@ -70,9 +104,12 @@ class Version:
 
     def _init_from_string(self, version_string: str):
         """Initialize from a version string (original behavior)."""
+        if _is_plain_semver(version_string):
+            # Fast path: no prefix or suffix to preserve around X.Y.Z[-pre][+build]
+            self._version = PackagingVersion(version_string)
+            self._original_format = None
         # Extract semantic version core using regex
-        version_pattern = r"(?:^|[^\d])(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9\-]+))?(?:\+([a-zA-Z0-9\-\.]+))?(?:[^\d]|$)"
-        if match := re.search(version_pattern, version_string):
+        elif match := VERSION_CORE_PATTERN.search(version_string):
             self._define_version_original_format(match, version_string)
         else:
             # Fallback to old behavior for simple cases
@@ -248,9 +285,13 @@ class Version:
             raise ValueError(f"Invalid version components: {version_parts}") from e
 
     @classmethod
+    @lru_cache(maxsize=1024)
     def parse(cls, version_str: str) -> "Version":
         """Parse a version string into a Version object.
 
+        Results are cached per string. Version instances are never mutated
+        after construction (bump() returns a new one), so they can be shared.
+
         Args:
             version_str: String in semver format (X.Y.Z[-pre][+build])
 
@@ -267,11 +308,16 @@ class Version:
 
         Uses original format template if available, otherwise falls back to SemVer format
         with preserved prefix (like 'v') if it was present in the input.
+        The SemVer form is computed once; templates are rendered on every call
+        because they may contain date and time placeholders.
         """
         # Use original format template if available
         if self._original_format:
             return self.format_with_template(self._original_format)
 
+        if self._str is not None:
+            return self._str
+
         # Fallback to standard SemVer format with original prefix
         version = f"{self.major}.{self.minor}.{self.patch}"
 
@@ -284,6 +330,7 @@ class Version:
         if self.build:
             version += f"+{self.build}"
 
+        self._str = version
         return version
 
     def bump(
@@ -337,7 +384,7 @@ def bump_version(current: str, bump_type: VersionBumpType) -> str:
     return str(version.bump(bump_type))
 
 
-@dataclass
+@dataclass(frozen=True)
 class VersionFileConfig:
     """Configuration for a version file."""
 
@@ -350,12 +397,31 @@ class VersionFileConfig:
     encoding: str = "utf-8"
 
 
+@lru_cache(maxsize=32)
+def _version_file_configs(
+    version_files: Tuple[Union[str, Tuple[Tuple[str, object], ...]], ...],
+) -> Tuple[VersionFileConfig, ...]:
+    """Build file configs from version_files entries frozen by from_config.
+
+    Entries are either simple path strings or tuples of (key, value) pairs.
+    The configs are frozen, so the cached tuple can be shared between managers.
+    """
+    return tuple(
+        VersionFileConfig(path=entry)
+        if isinstance(entry, str)
+        else VersionFileConfig(**dict(entry))
+        for entry in version_files
+    )
+
+
 class VersionManager:
     """Manages version updates across multiple files."""
 
     def __init__(self, config_files: List[VersionFileConfig]):
         self.config_files = config_files
         self._handlers = {}
+        # path -> ((mtime_ns, size), version) from the last read of that file
+        self._version_cache: Dict[str, Tuple[Tuple[int, int], Optional[Version]]] = {}
         self._setup_handlers()
 
     def _setup_handlers(self):
@@ -382,24 +448,59 @@ class VersionManager:
             )
             self._handlers[str(config.path)] = handler
 
+    def _read_version(self, path: str, handler) -> Optional[Version]:
+        """Read a file's version, reusing the last result while it is unchanged."""
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return handler.read_version()
+
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if (cached := self._version_cache.get(path)) and cached[0] == stat_key:
+            return cached[1]
+
+        version = handler.read_version()
+        self._version_cache[path] = (stat_key, version)
+        return version
+
     def read_versions(self) -> Dict[str, Optional[Version]]:
         """Read versions from all configured files."""
         versions = {}
         for path, handler in self._handlers.items():
             try:
-                version = handler.read_version()
+                version = self._read_version(path, handler)
                 versions[path] = version
             except Exception as e:
                 logger.warning(f"Could not read version from {path}: {e}")
                 versions[path] = None
         return versions
 
+    def _is_current_version(self, path: str, version: Version) -> bool:
+        """Check a version against the cached read of an unchanged file."""
+        if not (cached := self._version_cache.get(path)) or cached[1] is None:
+            return False
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return False
+        return cached[0] == (stat.st_mtime_ns, stat.st_size) and str(cached[1]) == str(
+            version
+        )
+
     def write_versions(self, version: Version) -> List[str]:
-        """Write version to all configured files."""
+        """Write version to all configured files.
+
+        Files whose last read version equals the new one are left untouched
+        and are not included in the returned list.
+        """
         updated_files = []
         for path, handler in self._handlers.items():
+            if self._is_current_version(path, version):
+                logger.debug("Version in {} is already {}", path, version)
+                continue
             try:
                 handler.write_version(version)
+                self._version_cache.pop(path, None)
                 updated_files.append(path)
             except Exception as e:
                 logger.warning(f"Could not write version to {path}: {e}")
@@ -410,8 +511,9 @@ class VersionManager:
         if not self.config_files:
             return None
 
-        if handler := self._handlers.get(str(self.config_files[0].path)):
-            return handler.read_version()
+        path = str(self.config_files[0].path)
+        if handler := self._handlers.get(path):
+            return self._read_version(path, handler)
         return None
 
     def validate_version_consistency(self) -> bool:
@@ -435,13 +537,19 @@ class VersionManager:
             version_file = config.get("version_file", "pyproject.toml")
             version_files = [{"path": version_file}]
 
-        configs = []
-        for file_config in version_files:
-            if isinstance(file_config, str):
-                # Simple path string
-                configs.append(VersionFileConfig(path=file_config))
-            else:
-                # Full configuration object
-                configs.append(VersionFileConfig(**file_config))
+        # Simple path strings stay as-is; full configuration objects become
+        # hashable tuples of items so parsed configs can be cached
+        frozen_files = tuple(
+            file_config if isinstance(file_config, str) else tuple(file_config.items())
+            for file_config in version_files
+        )
+        try:
+            hash(frozen_files)
+        except TypeError:
+            # Unhashable values (e.g. lists) cannot be cache keys
+            configs = _version_file_configs.__wrapped__(frozen_files)
+        else:
+            # Unknown keys still raise TypeError from VersionFileConfig
+            configs = _version_file_configs(frozen_files)
 
-        return cls(configs)
+        return cls(list(configs))
@@ -4,13 +4,13 @@ This hook is maintained for backward compatibility and as a fallback
 when the new prepare-commit-msg + post-commit hook system is not used.
 """
 
-import contextlib
 import os
+import re
 import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import tomli
 import tomli_w
@@ -28,6 +28,9 @@ logger = get_logger()
 # Lock file to prevent conflicts with post-commit hook
 LOCK_FILE = ".pezin_post_commit_lock"
 
+# Full SHA-1 or SHA-256 object id as stored in HEAD, refs and ORIG_HEAD
+_OBJECT_ID_PATTERN = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
 
 def clean_commit_message(msg: str) -> str:
     """Clean up commit message by removing Git comment lines and extra whitespace.
@@ -77,10 +80,122 @@ def is_post_commit_hook_active(repo_root: Path) -> bool:
     return lock_file.exists()
 
 
+def find_git_dir(cwd: Optional[Path] = None) -> Optional[Path]:
+    """Locate the git directory for a working directory without running git.
+
+    Honors GIT_DIR and follows `.git` files (worktrees, submodules).
+
+    Args:
+        cwd: Directory to start searching from. Defaults to the current directory.
+
+    Returns:
+        Path to the git directory, or None if it cannot be determined
+    """
+    if git_dir := os.environ.get("GIT_DIR"):
+        return Path(git_dir) if cwd is None else cwd / git_dir
+
+    cwd = Path(cwd).resolve() if cwd is not None else Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text().strip()
+            if not content.startswith("gitdir: "):
+                return None
+            return directory / content.removeprefix("gitdir: ")
+    return None
+
+
+def _read_ref(git_dir: Path, common_dir: Path, ref: str) -> Optional[str]:
+    """Read a ref from loose ref files or packed-refs; None if it does not exist."""
+    for base in (git_dir, common_dir):
+        if (ref_file := base / ref).is_file():
+            return ref_file.read_text().strip()
+
+    packed_refs = common_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref:
+                return sha
+    return None
+
+
+def _read_head_files(git_dir: Path) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """Read HEAD and ORIG_HEAD directly from the git directory.
+
+    Returns:
+        Tuple of (HEAD sha, ORIG_HEAD sha), or None if the repository layout
+        is not one this reader understands (e.g. the reftable backend)
+    """
+    common_dir = git_dir
+    if (commondir_file := git_dir / "commondir").is_file():
+        common_dir = git_dir / commondir_file.read_text().strip()
+    if (common_dir / "reftable").exists():
+        return None
+
+    head = (git_dir / "HEAD").read_text().strip()
+    if head.startswith("ref: "):
+        # An unresolvable branch ref means an unborn branch (no commits yet)
+        head_sha = _read_ref(git_dir, common_dir, head.removeprefix("ref: "))
+    else:
+        head_sha = head
+
+    orig_head_file = git_dir / "ORIG_HEAD"
+    orig_head_sha = (
+        orig_head_file.read_text().strip() if orig_head_file.is_file() else None
+    )
+
+    for sha in (head_sha, orig_head_sha):
+        if sha is not None and not _OBJECT_ID_PATTERN.fullmatch(sha):
+            return None
+    return head_sha, orig_head_sha
+
+
+def get_git_state(
+    cwd: Optional[Path] = None,
+) -> Tuple[Optional[Path], Optional[str], Optional[str]]:
+    """Resolve the git directory, HEAD and ORIG_HEAD.
+
+    The files in the git directory are read directly; git itself is only run
+    when the repository layout is not recognized.
+
+    Args:
+        cwd: Working directory of the repository. Defaults to the current directory.
+
+    Returns:
+        Tuple of (git directory, HEAD sha, ORIG_HEAD sha); each element is
+        None when it cannot be resolved.
+    """
+    if (git_dir := find_git_dir(cwd)) is not None:
+        try:
+            if (head_state := _read_head_files(git_dir)) is not None:
+                return git_dir, *head_state
+        except OSError as e:
+            logger.debug("Could not read git state from {}: {}", git_dir, e)
+
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-dir", "HEAD", "ORIG_HEAD"],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=cwd,
+    )
+    # rev-parse echoes unresolvable revisions verbatim and reports them as
+    # "fatal:" on stderr, so only keep lines that differ from the argument
+    lines = result.stdout.splitlines()
+    git_dir = Path(cwd or "", lines[0]) if lines else None
+    head_sha = lines[1] if len(lines) > 1 and lines[1] != "HEAD" else None
+    orig_head_sha = lines[2] if len(lines) > 2 and lines[2] != "ORIG_HEAD" else None
+    return git_dir, head_sha, orig_head_sha
+
+
 def is_amend_commit(
     commit_source: Optional[str] = None,
     commit_sha: Optional[str] = None,
     commit_message: Optional[str] = None,
+    cwd: Optional[Path] = None,
 ) -> bool:
     """Check if the current commit is an amend operation using prepare-commit-msg hook arguments.
 
@@ -88,38 +203,35 @@ def is_amend_commit(
         commit_source: The source of the commit message (from prepare-commit-msg hook)
         commit_sha: The SHA of the commit being amended (from prepare-commit-msg hook)
         commit_message: The commit message content (for legacy compatibility)
+        cwd: Working directory of the repository. Defaults to the current directory.
 
     Returns:
         True if this is an amend operation, False otherwise
     """
     logger.info("Starting amend detection")
-    logger.info(f"Commit source: {commit_source}")
-    logger.info(f"Commit SHA: {commit_sha}")
+    logger.info("Commit source: {}", commit_source)
+    logger.info("Commit SHA: {}", commit_sha)
 
     # Method 1: Use prepare-commit-msg hook arguments (most reliable)
     if commit_source == "commit":
         logger.info("Amend detected via prepare-commit-msg")
         if commit_sha:
-            logger.debug(f"Amending commit: {commit_sha[:7]}")
+            logger.debug("Amending commit: {:.7}", commit_sha)
         return True
 
     # Method 1.5: Check for rebase operations (should also be skipped)
     if commit_source in ["squash", "merge"]:
-        logger.info(f"Git operation '{commit_source}' detected - skipping version bump")
+        logger.info(
+            "Git operation '{}' detected - skipping version bump", commit_source
+        )
         return True
 
     # Fallback methods for backward compatibility when hook arguments are not available
     try:
-        # Method 2: Check for rebase operations in progress
-        with contextlib.suppress(subprocess.CalledProcessError):
-            git_dir_result = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            git_dir = Path(git_dir_result.stdout.strip())
+        git_dir, current_head_sha, orig_head_sha = get_git_state(cwd)
 
+        # Method 2: Check for rebase operations in progress
+        if git_dir is not None:
             # Check for rebase directories
             rebase_merge_dir = git_dir / "rebase-merge"
             rebase_apply_dir = git_dir / "rebase-apply"
@@ -140,44 +252,16 @@ def is_amend_commit(
             )
             return True
 
-        # Check if HEAD commit exists at all
-        head_result = subprocess.run(
-            ["git", "rev-parse", "--verify", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        if head_result.returncode != 0:
+        if git_dir is None or current_head_sha is None:
             # No HEAD commit exists, so this can't be an amend
             return False
 
         # Method 4: Check for ORIG_HEAD existence AND verify it matches current HEAD
         # During amend, ORIG_HEAD points to the commit being amended (same as current HEAD)
-        # Only check this in a real Git repository context
         try:
-            # Ensure we're in the correct Git repository context
-            current_head_sha = head_result.stdout.strip()
-
-            # Verify we can get the git directory relative to the current HEAD
-            try:
-                git_dir_result = subprocess.run(
-                    ["git", "rev-parse", "--git-dir"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                git_dir = Path(git_dir_result.stdout.strip())
-            except subprocess.CalledProcessError:
-                # If we can't get git directory, skip ORIG_HEAD check
-                return False
-
             orig_head_file = git_dir / "ORIG_HEAD"
 
-            if orig_head_file.exists():
-                # Read ORIG_HEAD content
-                orig_head_sha = orig_head_file.read_text().strip()
-
+            if orig_head_sha is not None and orig_head_file.exists():
                 # During amend, ORIG_HEAD equals current HEAD
                 # But also verify this is a recent operation by checking timestamps
                 orig_head_mtime = orig_head_file.stat().st_mtime
@@ -193,7 +277,12 @@ def is_amend_commit(
                     )
                     return True
 
-        except (subprocess.CalledProcessError, OSError):
+                # A recent ORIG_HEAD that differs from HEAD is conclusive as well,
+                # so there is no need to fall back to comparing commit messages
+                logger.info("ORIG_HEAD differs from current HEAD - not an amend")
+                return False
+
+        except OSError:
             pass
 
         # Method 5: Compare with HEAD commit message as fallback (for legacy compatibility)
@@ -203,6 +292,7 @@ def is_amend_commit(
                 capture_output=True,
                 text=True,
                 check=True,
+                cwd=cwd,
             )
             head_message = result.stdout.strip()
 
@@ -211,10 +301,10 @@ def is_amend_commit(
             clean_head_message = head_message.strip()
 
             logger.info("Comparing commit messages for amend detection")
-            logger.info(f"Clean commit message: '{clean_commit_message_text}'")
-            logger.info(f"Clean HEAD message: '{clean_head_message}'")
+            logger.info("Clean commit message: '{}'", clean_commit_message_text)
+            logger.info("Clean HEAD message: '{}'", clean_head_message)
             logger.info(
-                f"Messages equal: {clean_commit_message_text == clean_head_message}"
+                "Messages equal: {}", clean_commit_message_text == clean_head_message
             )
 
             # If the commit message being processed is identical to HEAD's message,
@@ -227,7 +317,7 @@ def is_amend_commit(
         return False
 
     except subprocess.CalledProcessError as e:
-        logger.error(f"Git command failed during amend detection: {e}")
+        logger.error("Git command failed during amend detection: {}", e)
         # If we can't determine git state, assume it's not an amend
         return False
 
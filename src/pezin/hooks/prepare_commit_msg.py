@@ -16,6 +16,9 @@ from ..logging import get_logger, setup_logging
 setup_logging()
 logger = get_logger()
 
+# Environment variables worth logging when debugging the hook
+LOGGED_ENV_VARS = ("GIT_EDITOR", "GIT_REFLOG_ACTION")
+
 
 def get_repo_root() -> Path:
     """Get the Git repository root directory."""
@@ -46,19 +49,19 @@ def is_amend_commit(
         True if this is an amend operation, False otherwise
     """
     logger.debug("Starting amend detection for prepare-commit-msg")
-    logger.debug(f"Commit source: {commit_source}")
-    logger.debug(f"Commit SHA: {commit_sha}")
+    logger.debug("Commit source: {}", commit_source)
+    logger.debug("Commit SHA: {}", commit_sha)
 
     # Method 1: Use prepare-commit-msg hook arguments (most reliable)
     if commit_source == "commit":
         logger.info("Amend detected via prepare-commit-msg hook arguments")
         if commit_sha:
-            logger.debug(f"Amending commit: {commit_sha[:7]}")
+            logger.debug("Amending commit: {:.7}", commit_sha)
         return True
 
     # Method 2: Check for rebase operations (should also be skipped)
     if commit_source in ["squash", "merge"]:
-        logger.info(f"Git operation '{commit_source}' detected - skipping validation")
+        logger.info("Git operation '{}' detected - skipping validation", commit_source)
         return True
 
     # Method 3: Check for rebase operations in progress
@@ -81,7 +84,7 @@ def is_amend_commit(
 
     # Method 4: Check environment variables that might indicate an amend or rebase
     git_reflog_action = os.environ.get("GIT_REFLOG_ACTION", "")
-    logger.debug(f"GIT_REFLOG_ACTION: {git_reflog_action}")
+    logger.debug("GIT_REFLOG_ACTION: {}", git_reflog_action)
 
     if "amend" in git_reflog_action.lower() or "rebase" in git_reflog_action.lower():
         logger.info("GIT_REFLOG_ACTION indicates amend/rebase - skipping validation")
@@ -127,10 +130,10 @@ def validate_commit_message(message: str) -> bool:
             return True
 
         commit = ConventionalCommit.parse(message)
-        logger.debug(f"Valid conventional commit: {commit.type}")
+        logger.debug("Valid conventional commit: {}", commit.type)
         return True
     except Exception as e:
-        logger.debug(f"Not a conventional commit: {e}")
+        logger.debug("Not a conventional commit: {}", e)
         return False
 
 
@@ -162,10 +165,11 @@ def main(
     try:
         commit_analysis(commit_msg_file, commit_source, commit_sha)
     except Exception as e:
-        logger.error(f"Prepare-commit-msg hook failed: {e}")
+        logger.error("Prepare-commit-msg hook failed: {}", e)
         import traceback
 
-        logger.debug(f"Traceback: {traceback.format_exc()}")
+        # Only format the traceback if a sink actually accepts DEBUG records
+        logger.opt(lazy=True).debug("Traceback: {}", traceback.format_exc)
         # Don't fail the commit on hook errors
         sys.exit(0)
 
@@ -175,7 +179,10 @@ def commit_analysis(commit_msg_file, commit_source, commit_sha):
 
     # Log hook arguments for debugging
     logger.debug(
-        f"Hook arguments: file={commit_msg_file}, source={commit_source}, sha={commit_sha}"
+        "Hook arguments: file={}, source={}, sha={}",
+        commit_msg_file,
+        commit_source,
+        commit_sha,
     )
 
     # Handle case where commit_msg_file is not provided (e.g., during rebase)
@@ -190,14 +197,14 @@ def commit_analysis(commit_msg_file, commit_source, commit_sha):
                 repo_root = get_repo_root()
                 skip_flag = repo_root / ".pezin_skip_version_bump"
                 skip_flag.write_text("rebase_operation")
-                logger.debug(f"Created skip flag: {skip_flag}")
+                logger.debug("Created skip flag: {}", skip_flag)
             except Exception as e:
-                logger.warning(f"Failed to create skip flag: {e}")
+                logger.warning("Failed to create skip flag: {}", e)
         sys.exit(0)
 
     # Ensure the file exists before proceeding
     if not commit_msg_file.exists():
-        logger.debug(f"Commit message file {commit_msg_file} does not exist - exiting")
+        logger.debug("Commit message file {} does not exist - exiting", commit_msg_file)
         sys.exit(0)
 
     # Check if we should skip this hook
@@ -213,9 +220,9 @@ def commit_analysis(commit_msg_file, commit_source, commit_sha):
             repo_root = get_repo_root()
             skip_flag = repo_root / ".pezin_skip_version_bump"
             skip_flag.write_text("amend")
-            logger.debug(f"Created skip flag: {skip_flag}")
+            logger.debug("Created skip flag: {}", skip_flag)
         except Exception as e:
-            logger.warning(f"Failed to create skip flag: {e}")
+            logger.warning("Failed to create skip flag: {}", e)
         sys.exit(0)
 
     # Read commit message
@@ -233,20 +240,20 @@ def commit_analysis(commit_msg_file, commit_source, commit_sha):
             repo_root = get_repo_root()
             skip_flag = repo_root / ".pezin_skip_version_bump"
             skip_flag.write_text("fixup_commit")
-            logger.debug(f"Created skip flag: {skip_flag}")
+            logger.debug("Created skip flag: {}", skip_flag)
         except Exception as e:
-            logger.warning(f"Failed to create skip flag: {e}")
+            logger.warning("Failed to create skip flag: {}", e)
         sys.exit(0)
 
     # Log basic info
-    logger.debug(f"Processing commit message: '{message}'")
-    logger.debug(f"Current working directory: {os.getcwd()}")
+    logger.debug("Processing commit message: '{}'", message)
+    logger.opt(lazy=True).debug("Current working directory: {}", os.getcwd)
 
     # Log relevant environment variables for debugging
     logger.debug("=== Environment Variables ===")
-    for key in sorted(os.environ.keys()):
-        if "GIT" in key.upper() and key in ["GIT_REFLOG_ACTION", "GIT_EDITOR"]:
-            logger.debug(f"ENV {key}={os.environ[key]}")
+    for key in LOGGED_ENV_VARS:
+        if (value := os.environ.get(key)) is not None:
+            logger.debug("ENV {}={}", key, value)
 
     # Validate commit message format (optional - don't fail on invalid)
     if validate_commit_message(message):
@@ -0,0 +1,27 @@
+"""Fixtures shared by the CLI tests."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def test_files(tmp_path: Path):
+    """Create and copy test files to a directory."""
+
+    def _create_files(path: Path, copy_defaults: bool = True):
+        path.mkdir(parents=True, exist_ok=True)
+        # Creating test files in specified path
+
+        if copy_defaults:
+            # Create version file
+            version_file = path / "pyproject.toml"
+            version_file.write_bytes(b'[project]\nversion = "0.1.0"\n')
+
+            # Create changelog file
+            changelog_file = path / "CHANGELOG.md"
+            changelog_file.write_bytes(b"# Changelog\n\n## [Unreleased]\n")
+
+        return path
+
+    return _create_files
@@ -1,49 +1,24 @@
 """CLI test suite."""
 
 import re
+import tomllib
 from pathlib import Path
 
 import pytest
-import tomli
-from typer.testing import CliRunner
 
 from pezin.cli.main import app
 
 # Test logging is handled by pytest configuration
 
+_PYPROJECT_010 = b'[project]\nversion = "0.1.0"\n'
+_CHANGELOG_INIT = b"# Changelog\n\n## [Unreleased]\n"
 
-def strip_ansi_codes(text: str) -> str:
-    """Strip ANSI color codes from text to make tests CI-compatible."""
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
-
-
-@pytest.fixture
-def cli_runner():
-    """Fixture providing a Typer CLI test runner."""
-    return CliRunner()
-
-
-@pytest.fixture
-def test_files(tmp_path: Path):
-    """Create and copy test files to a directory."""
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
-    def _create_files(path: Path, copy_defaults: bool = True):
-        path.mkdir(parents=True, exist_ok=True)
-        # Creating test files in specified path
 
-        if copy_defaults:
-            # Create version file
-            version_file = path / "pyproject.toml"
-            version_file.write_text('[project]\nversion = "0.1.0"\n')
-
-            # Create changelog file
-            changelog_file = path / "CHANGELOG.md"
-            changelog_file.write_text("# Changelog\n\n## [Unreleased]\n")
-
-        return path
-
-    return _create_files
+def strip_ansi_codes(text: str) -> str:
+    """Strip ANSI color codes from text to make tests CI-compatible."""
+    return ANSI_ESCAPE_PATTERN.sub("", text)
 
 
 @pytest.fixture
@@ -64,9 +39,9 @@ version = "{version}"
 ''')
         elif project_type == "package_json":
             config_file = project_dir / "package.json"
-            import json
-
-            config_file.write_text(json.dumps({"name": name, "version": version}))
+            config_file.write_bytes(
+                f'{{"name": "{name}", "version": "{version}"}}'.encode()
+            )
         elif project_type == "pezin_toml":
             config_file = project_dir / "pezin.toml"
             config_file.write_text(f'''[project]
@@ -99,161 +74,145 @@ def test_bump_command_help(cli_runner):
     assert "--pre" in clean_output
 
 
-def test_bump_command_basic(cli_runner, test_files, tmp_path):
-    """Test basic version bump command."""
-    with cli_runner.isolated_filesystem() as td:
-        test_dir = Path(td)
-        version_file = test_dir / "pyproject.toml"
-        version_file.write_text('[project]\nversion = "0.1.0"\n')
-
-        changelog_file = test_dir / "CHANGELOG.md"
-        changelog_file.write_text("# Changelog\n\n## [Unreleased]\n")
-
-        result = cli_runner.invoke(app, ["patch", "-m", "fix: test fix"])
-        assert result.exit_code == 0, f"Command failed:\n{result.output}"
-
-        # Verify version bump
-        with open(version_file, "rb") as f:
-            config = tomli.load(f)
-        assert config["project"]["version"] == "0.1.1"
-
-        # Verify changelog update
-        changelog = changelog_file.read_text()
-        assert "## [0.1.1]" in changelog
-        assert "test fix" in changelog
-
-
-def test_bump_command_config(cli_runner, test_files, tmp_path):
-    """Test bump command with custom configuration."""
-    with cli_runner.isolated_filesystem() as td:
-        test_dir = Path(td)
-
-        # Create config file with version in it
-        config_file = test_dir / "pezin.toml"
-        config_file.write_text("""
+@pytest.mark.parametrize(
+    ("files", "config_name", "version_name", "changelog_name", "description"),
+    [
+        pytest.param(
+            {
+                "pyproject.toml": _PYPROJECT_010,
+                "CHANGELOG.md": _CHANGELOG_INIT,
+            },
+            None,
+            "pyproject.toml",
+            "CHANGELOG.md",
+            "test fix",
+            id="basic",
+        ),
+        pytest.param(
+            {
+                "pezin.toml": b"""
 [project]
 version = "0.1.0"
 
 [pezin]
 changelog_file = "custom_changelog.md"
-""")
-
-        # Create changelog file
-        changelog_file = test_dir / "custom_changelog.md"
-        changelog_file.write_text("# Changelog\n\n## [Unreleased]\n")
-
-        # Test directory setup with config file
-
-        result = cli_runner.invoke(
-            app, ["patch", "--config", str(config_file), "-m", "fix: config test"]
-        )
-        if result.exit_code != 0:
-            print(f"Command output:\n{result.output}")
-
-        assert result.exit_code == 0, f"Command failed:\n{result.output}"
-
-        # Verify changes
-        with open(config_file, "rb") as f:
-            data = tomli.load(f)
-            assert data["project"]["version"] == "0.1.1"
-
-        assert "## [0.1.1]" in changelog_file.read_text()
-        assert "config test" in changelog_file.read_text()
-
-
-def test_bump_command_external_version(cli_runner, test_files, tmp_path):
-    """Test bump command with version in external file."""
-    with cli_runner.isolated_filesystem() as td:
-        test_dir = Path(td)
-
-        # Create external version file
-        version_file = test_dir / "VERSION"
-        version_file.write_text("0.1.0")
-
-        # Create config file referencing external version
-        config_file = test_dir / "pezin.toml"
-        config_file.write_text("""
+""",
+                "custom_changelog.md": _CHANGELOG_INIT,
+            },
+            "pezin.toml",
+            "pezin.toml",
+            "custom_changelog.md",
+            "config test",
+            id="config",
+        ),
+        pytest.param(
+            {
+                "VERSION": b"0.1.0",
+                "pezin.toml": b"""
 [pezin]
 version_file = "VERSION"
 changelog_file = "CHANGES.md"
-""")
-
-        # Create changelog file
-        changelog_file = test_dir / "CHANGES.md"
-        changelog_file.write_text("# Changelog\n\n## [Unreleased]\n")
-
-        # Test directory setup with external version file
-
-        result = cli_runner.invoke(
-            app, ["patch", "--config", str(config_file), "-m", "fix: external version"]
-        )
-        if result.exit_code != 0:
-            print(f"Command output:\n{result.output}")
-
-        assert result.exit_code == 0, f"Command failed:\n{result.output}"
-
-        # Verify changes
+""",
+                "CHANGES.md": _CHANGELOG_INIT,
+            },
+            "pezin.toml",
+            "VERSION",
+            "CHANGES.md",
+            "external version",
+            id="external_version",
+        ),
+    ],
+)
+def test_bump_command(
+    cli_runner,
+    tmp_path,
+    monkeypatch,
+    files,
+    config_name,
+    version_name,
+    changelog_name,
+    description,
+):
+    """Test version bump command with default, custom and external config."""
+    monkeypatch.chdir(tmp_path)
+    for name, content in files.items():
+        (tmp_path / name).write_bytes(content)
+
+    args = ["patch", "-m", f"fix: {description}"]
+    if config_name:
+        args += ["--config", str(tmp_path / config_name)]
+
+    result = cli_runner.invoke(app, args)
+    assert result.exit_code == 0, f"Command failed:\n{result.output}"
+
+    # Verify version bump
+    version_file = tmp_path / version_name
+    if version_file.suffix == ".toml":
+        with open(version_file, "rb") as f:
+            assert tomllib.load(f)["project"]["version"] == "0.1.1"
+    else:
         assert version_file.read_text().strip() == "0.1.1"
-        assert "## [0.1.1]" in changelog_file.read_text()
-        assert "external version" in changelog_file.read_text()
 
+    # Verify changelog update
+    changelog = (tmp_path / changelog_name).read_text()
+    assert "## [0.1.1]" in changelog
+    assert description in changelog
 
-def test_bump_command_valid_prerelease(cli_runner, test_files):
+
+def test_bump_command_valid_prerelease(cli_runner, test_files, tmp_path, monkeypatch):
     """Test bump command with valid pre-release label."""
-    with cli_runner.isolated_filesystem() as td:
-        test_dir = Path(td)
-        version_file = test_dir / "pyproject.toml"
-        version_file.write_text('[project]\nversion = "0.1.0"\n')
+    monkeypatch.chdir(tmp_path)
+    test_dir = tmp_path
+    version_file = test_dir / "pyproject.toml"
+    version_file.write_bytes(_PYPROJECT_010)
 
-        changelog_file = test_dir / "CHANGELOG.md"
-        changelog_file.write_text("# Changelog\n\n## [Unreleased]\n")
+    changelog_file = test_dir / "CHANGELOG.md"
+    changelog_file.write_bytes(_CHANGELOG_INIT)
 
-        result = cli_runner.invoke(
-            app, ["patch", "--pre", "beta", "-m", "fix: test with beta"]
-        )
-        assert result.exit_code == 0
+    result = cli_runner.invoke(
+        app, ["patch", "--pre", "beta", "-m", "fix: test with beta"]
+    )
+    assert result.exit_code == 0
 
-        # Verify version bump with prerelease
-        with open(version_file, "rb") as f:
-            config = tomli.load(f)
-        assert config["project"]["version"] == "0.1.1-beta"
+    # Verify version bump with prerelease
+    with open(version_file, "rb") as f:
+        config = tomllib.load(f)
+    assert config["project"]["version"] == "0.1.1-beta"
 
 
-def test_bump_command_invalid_prerelease(cli_runner, test_files):
+def test_bump_command_invalid_prerelease(cli_runner, test_files, tmp_path, monkeypatch):
     """Test bump command with invalid pre-release label."""
-    with cli_runner.isolated_filesystem() as td:
-        test_dir = Path(td)
-        version_file = test_dir / "pyproject.toml"
-        version_file.write_text('[project]\nversion = "0.1.0"\n')
+    monkeypatch.chdir(tmp_path)
+    test_dir = tmp_path
+    version_file = test_dir / "pyproject.toml"
+    version_file.write_bytes(_PYPROJECT_010)
 
-        result = cli_runner.invoke(
-            app, ["patch", "--pre", "invalid", "-m", "fix: test"]
-        )
-        assert result.exit_code == 2
-        assert "alpha, beta, rc" in result.output
+    result = cli_runner.invoke(app, ["patch", "--pre", "invalid", "-m", "fix: test"])
+    assert result.exit_code == 2
+    assert "alpha, beta, rc" in result.output
 
 
-def test_bump_command_no_version_file(cli_runner):
+def test_bump_command_no_version_file(cli_runner, tmp_path, monkeypatch):
     """Test bump command when version file doesn't exist."""
-    with cli_runner.isolated_filesystem():
-        result = cli_runner.invoke(app, ["patch", "-m", "fix: test"])
-        assert result.exit_code == 1
-        assert "Version file not found" in result.output
+    monkeypatch.chdir(tmp_path)
+    result = cli_runner.invoke(app, ["patch", "-m", "fix: test"])
+    assert result.exit_code == 1
+    assert "Version file not found" in result.output
 
 
-def test_bump_command_no_changelog(cli_runner, test_files):
+def test_bump_command_no_changelog(cli_runner, test_files, tmp_path, monkeypatch):
     """Test bump command when changelog doesn't exist."""
-    with cli_runner.isolated_filesystem() as td:
-        test_dir = Path(td)
-        version_file = test_dir / "pyproject.toml"
-        version_file.write_text('[project]\nversion = "0.1.0"\n')
+    monkeypatch.chdir(tmp_path)
+    test_dir = tmp_path
+    version_file = test_dir / "pyproject.toml"
+    version_file.write_bytes(_PYPROJECT_010)
 
-        result = cli_runner.invoke(app, ["patch", "-m", "fix: test"])
-        assert result.exit_code == 0, f"Command failed:\n{result.output}"
+    result = cli_runner.invoke(app, ["patch", "-m", "fix: test"])
+    assert result.exit_code == 0, f"Command failed:\n{result.output}"
 
-        changelog_file = test_dir / "CHANGELOG.md"
-        assert changelog_file.exists()
-        assert "## [0.1.1]" in changelog_file.read_text()
+    changelog_file = test_dir / "CHANGELOG.md"
+    assert changelog_file.exists()
+    assert "## [0.1.1]" in changelog_file.read_text()
 
 
 def test_version_flag_clean_output(cli_runner):
@@ -294,37 +253,28 @@ def test_version_flag_vs_version_command_consistency(cli_runner):
     assert result_flag.output == result_command.output
 
 
-def test_project_version_detection_functions(test_project_files):
+def test_project_version_detection_functions(test_project_files, monkeypatch):
     """Test the project version detection functions work correctly."""
-    import os
-
     from pezin.cli.main import get_current_project_info, get_version_quietly
 
     # Test pyproject.toml detection
     project_dir, config_file = test_project_files("pyproject", "my-project", "2.1.0")
 
     # Change to project directory for testing
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(project_dir)
-
-        # Test quiet version reading
-        version = get_version_quietly(config_file)
-        assert version == "2.1.0"
+    monkeypatch.chdir(project_dir)
 
-        # Test project info detection
-        name, version = get_current_project_info()
-        assert name == "my-project"
-        assert version == "2.1.0"
+    # Test quiet version reading
+    version = get_version_quietly(config_file)
+    assert version == "2.1.0"
 
-    finally:
-        os.chdir(original_cwd)
+    # Test project info detection
+    name, version = get_current_project_info()
+    assert name == "my-project"
+    assert version == "2.1.0"
 
 
-def test_project_version_detection_package_json(test_project_files):
+def test_project_version_detection_package_json(test_project_files, monkeypatch):
     """Test version detection with package.json files."""
-    import os
-
     from pezin.cli.main import get_current_project_info, get_version_quietly
 
     # Test package.json detection
@@ -333,132 +283,96 @@ def test_project_version_detection_package_json(test_project_files):
     )
 
     # Change to project directory for testing
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(project_dir)
+    monkeypatch.chdir(project_dir)
 
-        # Test quiet version reading
-        version = get_version_quietly(config_file)
-        assert version == "3.2.1"
+    # Test quiet version reading
+    version = get_version_quietly(config_file)
+    assert version == "3.2.1"
 
-        # Test project info detection
-        name, version = get_current_project_info()
-        assert name == "my-node-project"
-        assert version == "3.2.1"
+    # Test project info detection
+    name, version = get_current_project_info()
+    assert name == "my-node-project"
+    assert version == "3.2.1"
 
-    finally:
-        os.chdir(original_cwd)
 
-
-def test_project_version_detection_no_config(tmp_path):
+def test_project_version_detection_no_config(tmp_path, monkeypatch):
     """Test version detection when no config file exists."""
-    import os
-
     from pezin.cli.main import get_current_project_info
 
     # Create empty directory
     empty_dir = tmp_path / "empty"
     empty_dir.mkdir()
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(empty_dir)
+    monkeypatch.chdir(empty_dir)
 
-        # Should return None, None when no config found
-        name, version = get_current_project_info()
-        assert name is None
-        assert version is None
+    # Should return None, None when no config found
+    name, version = get_current_project_info()
+    assert name is None
+    assert version is None
 
-    finally:
-        os.chdir(original_cwd)
 
-
-def test_version_ci_flag_outputs_raw_version(test_project_files, cli_runner):
+def test_version_ci_flag_outputs_raw_version(
+    test_project_files, cli_runner, monkeypatch
+):
     """Test that -v --ci outputs only the raw version number."""
-    import os
-
     project_dir, _config_file = test_project_files("pyproject", "my-project", "15.0.5")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(project_dir)
+    monkeypatch.chdir(project_dir)
 
-        result = cli_runner.invoke(app, ["-v", "--ci"])
-        assert result.exit_code == 0
-        # Should output only the version, nothing else
-        output = result.output.strip()
-        assert output == "15.0.5"
-        # Should not contain project name or pezin
-        assert "my-project" not in output
-        assert "pezin" not in output
-
-    finally:
-        os.chdir(original_cwd)
+    result = cli_runner.invoke(app, ["-v", "--ci"])
+    assert result.exit_code == 0
+    # Should output only the version, nothing else
+    output = result.output.strip()
+    assert output == "15.0.5"
+    # Should not contain project name or pezin
+    assert "my-project" not in output
+    assert "pezin" not in output
 
 
-def test_version_command_ci_flag_outputs_raw_version(test_project_files, cli_runner):
+def test_version_command_ci_flag_outputs_raw_version(
+    test_project_files, cli_runner, monkeypatch
+):
     """Test that version --ci outputs only the raw version number."""
-    import os
-
     project_dir, _config_file = test_project_files("pyproject", "my-project", "2.3.4")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(project_dir)
+    monkeypatch.chdir(project_dir)
 
-        result = cli_runner.invoke(app, ["version", "--ci"])
-        assert result.exit_code == 0
-        # Should output only the version, nothing else
-        output = result.output.strip()
-        assert output == "2.3.4"
-
-    finally:
-        os.chdir(original_cwd)
+    result = cli_runner.invoke(app, ["version", "--ci"])
+    assert result.exit_code == 0
+    # Should output only the version, nothing else
+    output = result.output.strip()
+    assert output == "2.3.4"
 
 
-def test_version_ci_flag_no_project_exits_error(tmp_path, cli_runner):
+def test_version_ci_flag_no_project_exits_error(tmp_path, cli_runner, monkeypatch):
     """Test that -v --ci exits with error when no project is found."""
-    import os
-
     # Create empty directory with no config files
     empty_dir = tmp_path / "empty"
     empty_dir.mkdir()
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(empty_dir)
-
-        result = cli_runner.invoke(app, ["-v", "--ci"])
-        assert result.exit_code == 1
-        # Should contain error message
-        output = strip_ansi_codes(result.output)
-        assert "Error" in output
-        assert "No project version found" in output
+    monkeypatch.chdir(empty_dir)
 
-    finally:
-        os.chdir(original_cwd)
+    result = cli_runner.invoke(app, ["-v", "--ci"])
+    assert result.exit_code == 1
+    # Should contain error message
+    output = strip_ansi_codes(result.output)
+    assert "Error" in output
+    assert "No project version found" in output
 
 
-def test_version_ci_flag_no_formatting(test_project_files, cli_runner):
+def test_version_ci_flag_no_formatting(test_project_files, cli_runner, monkeypatch):
     """Test that CI output has no Rich formatting or extra text."""
-    import os
-
     project_dir, _config_file = test_project_files("pyproject", "test-proj", "1.0.0")
 
-    original_cwd = os.getcwd()
-    try:
-        os.chdir(project_dir)
-
-        result = cli_runner.invoke(app, ["-v", "--ci"])
-        assert result.exit_code == 0
+    monkeypatch.chdir(project_dir)
 
-        output = result.output.strip()
-        # Should be just the version with no other characters
-        assert output == "1.0.0"
-        # No multiple lines
-        assert "\n" not in output
-        # No ANSI codes
-        assert output == strip_ansi_codes(output)
+    result = cli_runner.invoke(app, ["-v", "--ci"])
+    assert result.exit_code == 0
 
-    finally:
-        os.chdir(original_cwd)
+    output = result.output.strip()
+    # Should be just the version with no other characters
+    assert output == "1.0.0"
+    # No multiple lines
+    assert "\n" not in output
+    # No ANSI codes
+    assert output == strip_ansi_codes(output)
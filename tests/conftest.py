@@ -1,92 +1,146 @@
+import shutil
 import subprocess
-import tempfile
 from pathlib import Path
-from typing import Generator, Tuple
+from typing import Generator, Optional, Tuple
 
 import pytest
+from typer.testing import CliRunner
 
 
-@pytest.fixture
-def git_repo() -> Generator[Tuple[Path, subprocess.Popen], None, None]:
-    """Create a temporary git repository for testing.
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Fixture providing a Typer CLI test runner."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the initial git repository once per test session.
 
     This fixture:
-    1. Creates a temporary directory
-    2. Initializes a git repository
-    3. Sets up basic git config
-    4. Creates an initial commit
+    1. Initializes a git repository
+    2. Creates an initial commit
 
-    Yields:
-        Tuple containing:
-        - Path to repo directory
-        - subprocess.Popen object for the git daemon
+    Returns:
+        Path to the template repository (copy it before modifying)
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        repo_dir = Path(temp_dir)
-
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=repo_dir, check=True)
-
-        # Configure git
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=repo_dir,
-            check=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"], cwd=repo_dir, check=True
-        )
-
-        # Create initial files
-        pyproject = repo_dir / "pyproject.toml"
-        pyproject.write_text("""[project]
+    repo_dir = tmp_path_factory.mktemp("git_template")
+
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init", "-q", "-b", "main"],
+        cwd=repo_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create initial files
+    pyproject = repo_dir / "pyproject.toml"
+    pyproject.write_text("""[project]
 name = "test-project"
 version = "0.1.0"
 """)
 
-        readme = repo_dir / "README.md"
-        readme.write_text("# Test Project\n")
+    readme = repo_dir / "README.md"
+    readme.write_text("# Test Project\n")
 
-        changelog = repo_dir / "CHANGELOG.md"
-        changelog.write_text("""# Changelog
+    changelog = repo_dir / "CHANGELOG.md"
+    changelog.write_text("""# Changelog
 
 All notable changes to this project will be documented in this file.
 
 ## [Unreleased]
 """)
 
-        # Initial commit
-        subprocess.run(["git", "add", "."], cwd=repo_dir, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "chore: initial commit"], cwd=repo_dir, check=True
-        )
+    # Initial commit, with the identity passed inline instead of via git config
+    subprocess.run(
+        ["git", "add", "."],
+        cwd=repo_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.email=test@example.com",
+            "-c",
+            "user.name=Test User",
+            "commit",
+            "-q",
+            "-m",
+            "chore: initial commit",
+        ],
+        cwd=repo_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    return repo_dir
 
-        # Start git daemon for local operations
-        daemon = subprocess.Popen(
-            ["git", "daemon", "--reuseaddr", "--base-path=.", "--export-all", "."],
-            cwd=repo_dir,
-        )
 
-        yield repo_dir, daemon
+@pytest.fixture
+def git_repo(
+    git_repo_template: Path, tmp_path: Path
+) -> Tuple[Path, Optional[subprocess.Popen]]:
+    """Create a temporary git repository for testing.
+
+    The repository is copied from the session-wide template, so each test
+    gets its own initialized repository without re-running git setup.
+
+    Returns:
+        Tuple containing:
+        - Path to repo directory
+        - None (request the git_daemon fixture to serve the repository)
+    """
+    repo_dir = tmp_path / "repo"
+    shutil.copytree(git_repo_template, repo_dir)
 
-        # Cleanup
-        daemon.terminate()
-        daemon.wait()
+    return repo_dir, None
 
 
 @pytest.fixture
-def pre_commit_repo(git_repo: Tuple[Path, subprocess.Popen]) -> Path:
-    """Create a git repository with pre-commit hook configured.
+def git_daemon(
+    git_repo: Tuple[Path, Optional[subprocess.Popen]],
+) -> Generator[subprocess.Popen, None, None]:
+    """Serve the git_repo repository with git daemon for network operations.
+
+    Yields:
+        subprocess.Popen object for the git daemon
+    """
+    repo_dir, _ = git_repo
+
+    daemon = subprocess.Popen(
+        ["git", "daemon", "--reuseaddr", "--base-path=.", "--export-all", "."],
+        cwd=repo_dir,
+    )
+
+    yield daemon
+
+    # Cleanup
+    daemon.terminate()
+    daemon.wait()
+
+
+@pytest.fixture(scope="session")
+def pre_commit_repo_template(
+    git_repo_template: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Build a git repository with pre-commit hooks once per test session.
 
-    This fixture extends git_repo by:
+    This fixture extends git_repo_template by:
     1. Installing pre-commit
     2. Creating .pre-commit-config.yaml
     3. Installing hooks
 
     Returns:
-        Path to repository directory
+        Path to the template repository (copy it before modifying)
     """
-    repo_dir, _ = git_repo
+    repo_dir = tmp_path_factory.mktemp("pre_commit_template") / "repo"
+    shutil.copytree(git_repo_template, repo_dir)
 
     # Create pre-commit config
     config = repo_dir / ".pre-commit-config.yaml"
@@ -102,12 +156,32 @@ def pre_commit_repo(git_repo: Tuple[Path, subprocess.Popen]) -> Path:
 
     # Install pre-commit
     subprocess.run(
-        ["pre-commit", "install"], cwd=repo_dir, check=True, capture_output=True
+        ["pre-commit", "install"],
+        cwd=repo_dir,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
     return repo_dir
 
 
+@pytest.fixture
+def pre_commit_repo(pre_commit_repo_template: Path, tmp_path: Path) -> Path:
+    """Create a git repository with pre-commit hook configured.
+
+    The repository is copied from the session-wide template, so
+    ``pre-commit install`` runs only once per session.
+
+    Returns:
+        Path to repository directory
+    """
+    repo_dir = tmp_path / "repo"
+    shutil.copytree(pre_commit_repo_template, repo_dir, symlinks=True)
+
+    return repo_dir
+
+
 @pytest.fixture
 def temp_workspace(tmp_path: Path) -> Path:
     """Create a temporary workspace with basic project structure.
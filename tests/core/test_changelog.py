@@ -1,3 +1,4 @@
+import shutil
 from datetime import datetime
 
 import pytest
@@ -11,7 +12,7 @@ from pezin.core.changelog import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_commits():
     """Fixture providing sample conventional commits."""
     return [
@@ -24,11 +25,31 @@ def sample_commits():
     ]
 
 
+@pytest.fixture(scope="module")
+def default_manager():
+    """Fixture providing a changelog manager with the default config."""
+    return ChangelogManager(ChangelogConfig())
+
+
+@pytest.fixture(scope="module")
+def repo_manager():
+    """Fixture providing a changelog manager with a repository URL."""
+    return ChangelogManager(ChangelogConfig(repo_url="https://github.com/user/repo"))
+
+
+@pytest.fixture(scope="session")
+def _changelog_template(tmp_path_factory):
+    """Fixture writing the initial changelog once per session."""
+    path = tmp_path_factory.mktemp("changelog_template") / "CHANGELOG.md"
+    path.write_text("# Changelog\n\n## [Unreleased]\n")
+    return path
+
+
 @pytest.fixture
-def temp_changelog(tmp_path):
+def temp_changelog(tmp_path, _changelog_template):
     """Fixture providing a temporary changelog file."""
     path = tmp_path / "CHANGELOG.md"
-    path.write_text("# Changelog\n\n## [Unreleased]\n")
+    shutil.copyfile(_changelog_template, path)
     return path
 
 
@@ -146,13 +167,10 @@ def test_generate_version_links():
     assert any("[Unreleased]" in link for link in links)
 
 
-def test_update_changelog_new_version(temp_changelog, sample_commits):
+def test_update_changelog_new_version(repo_manager, temp_changelog, sample_commits):
     """Test updating changelog with a new version."""
-    config = ChangelogConfig(repo_url="https://github.com/user/repo")
-    manager = ChangelogManager(config)
-
     date = datetime(2023, 1, 1)
-    manager.update_changelog(temp_changelog, "1.0.0", sample_commits, date)
+    repo_manager.update_changelog(temp_changelog, "1.0.0", sample_commits, date)
 
     content = temp_changelog.read_text()
     assert "## [1.0.0] - 2023-01-01" in content
@@ -162,17 +180,16 @@ def test_update_changelog_new_version(temp_changelog, sample_commits):
     assert "[1.0.0]:" in content
 
 
-def test_update_changelog_multiple_versions(temp_changelog, sample_commits):
+def test_update_changelog_multiple_versions(
+    default_manager, temp_changelog, sample_commits
+):
     """Test updating changelog with multiple versions."""
-    config = ChangelogConfig()
-    manager = ChangelogManager(config)
-
     # Add first version
-    manager.update_changelog(temp_changelog, "1.0.0", sample_commits)
+    default_manager.update_changelog(temp_changelog, "1.0.0", sample_commits)
 
     # Add second version
     new_commits = [ConventionalCommit.parse("feat: another feature")]
-    manager.update_changelog(temp_changelog, "1.1.0", new_commits)
+    default_manager.update_changelog(temp_changelog, "1.1.0", new_commits)
 
     content = temp_changelog.read_text()
     assert "## [1.1.0]" in content
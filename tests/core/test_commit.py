@@ -15,6 +15,12 @@ def test_basic_commit_parsing():
     assert commit.footer is None
 
 
+def test_parse_returns_cached_instance():
+    """Test that parsing the same message twice reuses the frozen instance."""
+    message = "fix(core): cached parse"
+    assert ConventionalCommit.parse(message) is ConventionalCommit.parse(message)
+
+
 def test_commit_with_scope():
     """Test parsing commit with scope."""
     message = "fix(auth): fix login issue"
@@ -43,6 +49,17 @@ BREAKING CHANGE: This changes the API structure"""
     assert commit.footer == "BREAKING CHANGE: This changes the API structure"
 
 
+def test_breaking_change_hyphenated_footer():
+    """Test detecting breaking change with BREAKING-CHANGE footer."""
+    message = """feat(api): redesign endpoint
+
+BREAKING-CHANGE: This changes the API structure"""
+    commit = ConventionalCommit.parse(message)
+    assert commit.breaking
+    assert commit.body is None
+    assert commit.footer == "BREAKING-CHANGE: This changes the API structure"
+
+
 def test_commit_with_body():
     """Test parsing commit with body text."""
     message = """fix(core): handle edge case
@@ -8,6 +8,7 @@ import tomli_w
 
 from pezin.core.handlers import (
     COMMON_PATTERNS,
+    GENERIC_MMAP_THRESHOLD,
     FileHandlerFactory,
     GenericFileHandler,
     JsonFileHandler,
@@ -67,6 +68,28 @@ class TestTomlFileHandler:
         assert version is not None
         assert str(version) == "3.0.0"
 
+    def test_read_version_after_multiline_string(self, tmp_path):
+        """Test that key-like lines inside multi-line strings are ignored."""
+        toml_file = tmp_path / "pyproject.toml"
+        for quotes in ('"""', "'''"):
+            toml_file.write_text(
+                "[project]\n"
+                f"description = {quotes}\n"
+                'version = "9.9.9"\n'
+                f"{quotes}\n"
+                'version = "1.0.0"\n'
+            )
+
+            version = TomlFileHandler(toml_file).read_version()
+            assert str(version) == "1.0.0"
+
+    def test_read_version_invalid_toml(self, tmp_path):
+        """Test that a version line in an invalid TOML file is not read."""
+        toml_file = tmp_path / "pyproject.toml"
+        toml_file.write_text('[project]\nversion = "1.0.0"\n[bad\n')
+
+        assert TomlFileHandler(toml_file).read_version() is None
+
     def test_write_version_existing_section(self, tmp_path):
         """Test writing version to existing section."""
         toml_file = tmp_path / "pyproject.toml"
@@ -81,6 +104,63 @@ class TestTomlFileHandler:
         assert updated_data["project"]["version"] == "1.1.0"
         assert updated_data["project"]["name"] == "test"
 
+    def test_write_version_preserves_formatting(self, tmp_path):
+        """Test that writing a known key keeps comments, sections and line endings."""
+        toml_file = tmp_path / "pyproject.toml"
+        toml_file.write_text(
+            "# Project metadata\n"
+            "[project]\n"
+            'name = "test"\n'
+            'version = "1.0.0"  # bumped by pezin\n'
+            "\n"
+            "[tool.other]\n"
+            'version = "9.9.9"\n'
+        )
+
+        handler = TomlFileHandler(toml_file)
+        handler.read_version()  # Set _found_key
+        handler.write_version(Version("1.1.0"))
+
+        content = toml_file.read_text()
+        assert content.startswith("# Project metadata\n")
+        assert 'version = "1.1.0"  # bumped by pezin' in content
+        assert 'version = "9.9.9"' in content
+
+        # CRLF files keep their comments and line endings as well
+        toml_file.write_bytes(
+            b"# keep me\r\n"
+            b"[project]\r\n"
+            b'name = "test"\r\n'
+            b'version = "1.0.0"  # bumped\r\n'
+        )
+
+        handler = TomlFileHandler(toml_file)
+        handler.read_version()  # Set _found_key
+        handler.write_version(Version("1.1.0"))
+
+        assert toml_file.read_bytes() == (
+            b"# keep me\r\n"
+            b"[project]\r\n"
+            b'name = "test"\r\n'
+            b'version = "1.1.0"  # bumped\r\n'
+        )
+
+    def test_write_version_after_multiline_string(self, tmp_path):
+        """Test that writing never edits key-like lines inside strings."""
+        toml_file = tmp_path / "pyproject.toml"
+        toml_file.write_text(
+            '[project]\ndescription = """\nversion = "9.9.9"\n"""\nversion = "1.0.0"\n'
+        )
+
+        handler = TomlFileHandler(toml_file)
+        handler.read_version()  # Set _found_key
+        handler.write_version(Version("3.0.0"))
+
+        with open(toml_file, "rb") as f:
+            data = tomli.load(f)
+        assert data["project"]["version"] == "3.0.0"
+        assert data["project"]["description"] == 'version = "9.9.9"\n'
+
     def test_write_version_new_section(self, tmp_path):
         """Test writing version to new section."""
         toml_file = tmp_path / "new.toml"
@@ -240,6 +320,30 @@ CC = gcc
         assert version is not None
         assert str(version) == "2.5.0"
 
+    def test_read_version_large_file(self, tmp_path):
+        """Test reading version from a file large enough to be memory-mapped."""
+        makefile = tmp_path / "Makefile"
+        padding = "# generated\n" * (GENERIC_MMAP_THRESHOLD // 12 + 1)
+        makefile.write_text(f"PROJECT = test\n{padding}VERSION = 3.1.4\n")
+
+        pattern = COMMON_PATTERNS["makefile"]["pattern"]
+        handler = GenericFileHandler(makefile, pattern)
+        version = handler.read_version()
+
+        assert version is not None
+        assert str(version) == "3.1.4"
+
+    def test_read_version_large_file_non_ascii_pattern(self, tmp_path):
+        """Test that large files match patterns the same way small files do."""
+        padding = "# generated\n" * (GENERIC_MMAP_THRESHOLD // 12 + 1)
+        for pattern in (r"version[:：]\s*(\S+)", r"version\uff1a\s*(\S+)"):
+            for content in ("version： 2.7.1\n", f"{padding}version： 2.7.1\n"):
+                version_file = tmp_path / "VERSION.txt"
+                version_file.write_text(content, encoding="utf-8")
+
+                version = GenericFileHandler(version_file, pattern).read_version()
+                assert str(version) == "2.7.1"
+
     def test_write_version_makefile(self, tmp_path):
         """Test writing version to Makefile."""
         makefile = tmp_path / "Makefile"
@@ -258,6 +362,52 @@ CC = gcc
         assert "VERSION = 2.6.0" in updated_content
         assert "VERSION = 2.5.0" not in updated_content
 
+    def test_write_version_keeps_file_mode(self, tmp_path):
+        """Test that the atomic rewrite keeps permissions and leaves no temp file."""
+        script = tmp_path / "release.sh"
+        script.write_text('#!/bin/sh\nVERSION="1.0.0"\n')
+        script.chmod(0o755)
+
+        pattern = COMMON_PATTERNS["shell_script"]["pattern"]
+        replacement = COMMON_PATTERNS["shell_script"]["replacement"]
+        handler = GenericFileHandler(script, pattern, replacement)
+        handler.write_version(Version("1.0.1"))
+
+        assert 'VERSION="1.0.1"' in script.read_text()
+        assert script.stat().st_mode & 0o777 == 0o755
+        assert [p.name for p in tmp_path.iterdir()] == ["release.sh"]
+
+    def test_write_version_keeps_unrelated_tmp_file(self, tmp_path):
+        """Test that the atomic rewrite never reuses an existing sibling name."""
+        makefile = tmp_path / "Makefile"
+        makefile.write_text("VERSION = 1.0.0\n")
+        unrelated = tmp_path / ".Makefile.tmp"
+        unrelated.write_text("keep me")
+
+        pattern = COMMON_PATTERNS["makefile"]["pattern"]
+        replacement = COMMON_PATTERNS["makefile"]["replacement"]
+        GenericFileHandler(makefile, pattern, replacement).write_version(
+            Version("1.0.1")
+        )
+
+        assert makefile.read_text() == "VERSION = 1.0.1\n"
+        assert unrelated.read_text() == "keep me"
+
+    def test_write_version_after_external_change(self, tmp_path):
+        """Test that writing re-reads a file modified after read_version."""
+        makefile = tmp_path / "Makefile"
+        makefile.write_text("VERSION = 2.5.0\n")
+
+        pattern = COMMON_PATTERNS["makefile"]["pattern"]
+        replacement = COMMON_PATTERNS["makefile"]["replacement"]
+        handler = GenericFileHandler(makefile, pattern, replacement)
+        handler.read_version()
+
+        makefile.write_text("PROJECT = test\nVERSION = 2.5.0\n")
+        handler.write_version(Version("2.6.0"))
+
+        assert makefile.read_text() == "PROJECT = test\nVERSION = 2.6.0\n"
+
     def test_supports_file(self):
         """Test file support detection."""
         handler = GenericFileHandler(Path("dummy"), r".*")
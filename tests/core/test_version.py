@@ -52,6 +52,11 @@ def test_invalid_version():
         Version.parse("not.a.version")
 
 
+def test_version_parse_cached():
+    """Test that parsing the same string twice reuses the Version instance."""
+    assert Version.parse("4.5.6") is Version.parse("4.5.6")
+
+
 def test_version_bump_major():
     """Test major version bumping."""
     version = Version.parse("1.2.3")
@@ -167,6 +172,29 @@ class TestVersionManager:
         # Test version consistency
         assert manager.validate_version_consistency()
 
+    def test_read_after_write_sees_new_version(self, tmp_path):
+        """Test that cached reads are invalidated by write_versions."""
+        toml_file = tmp_path / "pyproject.toml"
+        toml_file.write_text(tomli_w.dumps({"project": {"version": "1.0.0"}}))
+
+        manager = VersionManager([VersionFileConfig(path=toml_file)])
+        assert str(manager.get_primary_version()) == "1.0.0"
+
+        manager.write_versions(Version("1.0.1"))
+        assert str(manager.get_primary_version()) == "1.0.1"
+
+    def test_write_same_version_skips_file(self, tmp_path):
+        """Test that writing the version a file already has leaves it untouched."""
+        toml_file = tmp_path / "pyproject.toml"
+        toml_file.write_text(tomli_w.dumps({"project": {"version": "1.0.0"}}))
+
+        manager = VersionManager([VersionFileConfig(path=toml_file)])
+        assert str(manager.get_primary_version()) == "1.0.0"
+        mtime_ns = toml_file.stat().st_mtime_ns
+
+        assert manager.write_versions(Version("1.0.0")) == []
+        assert toml_file.stat().st_mtime_ns == mtime_ns
+
     def test_write_multiple_files(self, tmp_path):
         """Test writing to multiple files."""
         # Create TOML file
@@ -271,6 +299,16 @@ class TestVersionManager:
         assert str(manager.config_files[0].path) == "pyproject.toml"
         assert str(manager.config_files[1].path) == "package.json"
 
+    def test_from_config_reuses_parsed_configs(self):
+        """Test that identical configs share the parsed file configs."""
+        config = {"version_files": ["pyproject.toml", {"path": "package.json"}]}
+
+        first = VersionManager.from_config(config)
+        second = VersionManager.from_config(config)
+        assert first.config_files == second.config_files
+        assert first.config_files[1] is second.config_files[1]
+        assert first.config_files is not second.config_files
+
     def test_empty_config(self):
         """Test creating VersionManager with empty config."""
         config = {}
@@ -0,0 +1,55 @@
+"""Fixtures shared by the hook tests."""
+
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pytest
+import tomli_w
+
+
+def _write_toml(path: Path, data: Dict[str, Any]) -> None:
+    """Serialize data to TOML and write it to path in a single call."""
+    path.write_bytes(tomli_w.dumps(data).encode("utf-8"))
+
+
+@pytest.fixture(scope="session")
+def hook_repo_head(git_repo_template: Path) -> str:
+    """Resolve the template repository's HEAD commit once per session.
+
+    Copies made by hook_repo share this commit, so tests can use it without
+    running git themselves.
+    """
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=git_repo_template,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def hook_repo(git_repo: Tuple[Path, Optional[subprocess.Popen]]) -> Path:
+    """Provide the git_repo repository directory for a hook test.
+
+    The repository holds pyproject.toml at version 0.1.0 and a single
+    "chore: initial commit" commit.
+
+    Returns:
+        Path to the repository directory
+    """
+    repo_dir, _ = git_repo
+    return repo_dir
+
+
+@pytest.fixture
+def version_file(tmp_path: Path) -> Path:
+    """Create a pyproject.toml at version 0.1.0 for a hook test.
+
+    Returns:
+        Path to the version file
+    """
+    path = tmp_path / "pyproject.toml"
+    _write_toml(path, {"project": {"version": "0.1.0"}})
+    return path
@@ -4,13 +4,17 @@ import subprocess
 from pathlib import Path
 
 import tomli
-import tomli_w
-from typer.testing import CliRunner
 
 # from pezin.hooks.pre_commit import app
 from pezin.cli.main import app
 from pezin.hooks.pre_commit import is_amend_commit
 
+# Commit messages written to the commit-msg file by the hook tests
+_FEAT_MSG = b"feat: add new feature"
+_CHORE_MSG = b"chore: update docs"
+_PRE_MSG = b"feat: alpha feature\n\n[pre-release=alpha]"
+_HEAD_MSG = b"chore: initial commit"
+
 
 def test_pre_commit_hook_installation(pre_commit_repo):
     """Test that pre-commit hook can be installed."""
@@ -23,22 +27,16 @@ def test_pre_commit_hook_installation(pre_commit_repo):
     assert hook_path.exists()
 
 
-def test_simple_version_bump(tmp_path):
+def test_simple_version_bump(cli_runner, tmp_path, version_file):
     """Test basic version bump functionality."""
     # Setup
     msg_file = tmp_path / "commit-msg"
-    version_file = tmp_path / "pyproject.toml"
-
-    # Create version file
-    with open(version_file, "wb") as f:
-        tomli_w.dump({"project": {"version": "0.1.0"}}, f)
 
     # Test feature bump
-    msg_file.write_text("feat: add new feature")
+    msg_file.write_bytes(_FEAT_MSG)
 
     # Run hook with explicit config pointing to our test file
-    runner = CliRunner()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         [
             "hook",
@@ -56,22 +54,17 @@ def test_simple_version_bump(tmp_path):
         assert version == "0.2.0"
 
 
-def test_no_version_bump(tmp_path):
+def test_no_version_bump(cli_runner, tmp_path, version_file):
     """Test no bump for chore commits."""
     # Setup files
     msg_file = tmp_path / "commit-msg"
-    version_file = tmp_path / "pyproject.toml"
-
-    # Create version file
-    with open(version_file, "wb") as f:
-        tomli_w.dump({"project": {"version": "0.1.0"}}, f)
 
     # Write chore commit
-    msg_file.write_text("chore: update docs")
+    msg_file.write_bytes(_CHORE_MSG)
+    mtime_ns = version_file.stat().st_mtime_ns
 
     # Run hook with explicit config pointing to our test file
-    runner = CliRunner()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         [
             "hook",
@@ -90,24 +83,19 @@ def test_no_version_bump(tmp_path):
     with open(version_file, "rb") as f:
         version = tomli.load(f)["project"]["version"]
         assert version == "0.1.0"
+    assert version_file.stat().st_mtime_ns == mtime_ns
 
 
-def test_prerelease_bump(tmp_path):
+def test_prerelease_bump(cli_runner, tmp_path, version_file):
     """Test pre-release version bump."""
     # Setup files
     msg_file = tmp_path / "commit-msg"
-    version_file = tmp_path / "pyproject.toml"
-
-    # Create version file
-    with open(version_file, "wb") as f:
-        tomli_w.dump({"project": {"version": "0.1.0"}}, f)
 
     # Write pre-release commit
-    msg_file.write_text("feat: alpha feature\n\n[pre-release=alpha]")
+    msg_file.write_bytes(_PRE_MSG)
 
     # Run hook with explicit config pointing to our test file
-    runner = CliRunner()
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         [
             "hook",
@@ -125,113 +113,50 @@ def test_prerelease_bump(tmp_path):
         assert "-alpha" in version
 
 
-def test_amend_commit_detection(tmp_path):
+def test_amend_commit_detection(hook_repo, tmp_path):
     """Test amend commit detection functionality."""
-    # Create a git repository
-    git_repo = tmp_path / "test_repo"
-    git_repo.mkdir()
+    # Test 1: Different message should not be detected as amend
+    different_message = "feat: different feature"
+    assert not is_amend_commit(commit_message=different_message, cwd=hook_repo)
 
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=git_repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"], cwd=git_repo, check=True
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"], cwd=git_repo, check=True
-    )
+    # Test 2: Same message as HEAD should be detected as amend
+    head_message = "chore: initial commit"
+    assert is_amend_commit(commit_message=head_message, cwd=hook_repo)
 
-    # Create a test file and make initial commit
-    test_file = git_repo / "test.txt"
-    test_file.write_text("initial content")
-    subprocess.run(["git", "add", "test.txt"], cwd=git_repo, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "feat: initial commit"], cwd=git_repo, check=True
-    )
+    # Test 3: Test prepare-commit-msg detection - amend case
+    assert is_amend_commit(commit_source="commit", commit_sha="abc123", cwd=hook_repo)
 
-    # Change to the git repo directory for testing
-    original_cwd = Path.cwd()
-    try:
-        import os
-
-        os.chdir(git_repo)
-
-        # Test 1: Different message should not be detected as amend
-        different_message = "feat: different feature"
-        assert not is_amend_commit(commit_message=different_message)
+    # Test 4: Test prepare-commit-msg detection - normal commit case
+    assert not is_amend_commit(commit_source="message", cwd=hook_repo)
 
-        # Test 2: Same message as HEAD should be detected as amend
-        head_message = "feat: initial commit"
-        assert is_amend_commit(commit_message=head_message)
+    # Test 5: Test prepare-commit-msg detection - no arguments (fallback)
+    assert not is_amend_commit(cwd=hook_repo)
 
-        # Test 3: Test prepare-commit-msg detection - amend case
-        assert is_amend_commit(commit_source="commit", commit_sha="abc123")
+    # Test 3: Empty repository case (create new repo)
+    empty_repo = tmp_path / "empty_repo"
+    empty_repo.mkdir()
+    subprocess.run(["git", "init"], cwd=empty_repo, check=True, capture_output=True)
 
-        # Test 4: Test prepare-commit-msg detection - normal commit case
-        assert not is_amend_commit(commit_source="message")
+    # No HEAD exists, should not be amend
+    assert not is_amend_commit(commit_message="feat: first commit", cwd=empty_repo)
 
-        # Test 5: Test prepare-commit-msg detection - no arguments (fallback)
-        assert not is_amend_commit()
 
-        # Test 3: Empty repository case (create new repo)
-        empty_repo = tmp_path / "empty_repo"
-        empty_repo.mkdir()
-        subprocess.run(["git", "init"], cwd=empty_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"], cwd=empty_repo, check=True
-        )
-        subprocess.run(
-            ["git", "config", "user.email", "test@example.com"],
-            cwd=empty_repo,
-            check=True,
-        )
-
-        os.chdir(empty_repo)
-        # No HEAD exists, should not be amend
-        assert not is_amend_commit(commit_message="feat: first commit")
-
-    finally:
-        os.chdir(original_cwd)
-
-
-def test_hook_skips_amend_commit(tmp_path):
+def test_hook_skips_amend_commit(cli_runner, hook_repo):
     """Test that the hook skips version bumping for amend commits."""
-    # Create git repository
-    git_repo = tmp_path / "test_repo"
-    git_repo.mkdir()
-
-    # Setup git repo
-    subprocess.run(["git", "init"], cwd=git_repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"], cwd=git_repo, check=True
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"], cwd=git_repo, check=True
-    )
-
-    # Create version file
-    version_file = git_repo / "pyproject.toml"
-    with open(version_file, "wb") as f:
-        tomli_w.dump({"project": {"version": "1.0.0"}}, f)
-
-    # Add and commit version file
-    subprocess.run(["git", "add", "pyproject.toml"], cwd=git_repo, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "feat: add version file"], cwd=git_repo, check=True
-    )
+    version_file = hook_repo / "pyproject.toml"
 
     # Create commit message file with same message as HEAD (simulating amend)
-    msg_file = git_repo / "commit-msg"
-    msg_file.write_text("feat: add version file")
+    msg_file = hook_repo / "commit-msg"
+    msg_file.write_bytes(_HEAD_MSG)
 
     # Run hook from the git repo directory
     original_cwd = Path.cwd()
     try:
         import os
 
-        os.chdir(git_repo)
+        os.chdir(hook_repo)
 
-        runner = CliRunner()
-        result = runner.invoke(app, ["hook", str(msg_file)])
+        result = cli_runner.invoke(app, ["hook", str(msg_file)])
 
         # Hook should exit successfully but skip version bump
         assert result.exit_code == 0
@@ -240,65 +165,30 @@ def test_hook_skips_amend_commit(tmp_path):
         # Version should remain unchanged
         with open(version_file, "rb") as f:
             version = tomli.load(f)["project"]["version"]
-            assert version == "1.0.0"  # Should not have changed
+            assert version == "0.1.0"  # Should not have changed
 
     finally:
         os.chdir(original_cwd)
 
 
-def test_orig_head_amend_detection(tmp_path):
+def test_orig_head_amend_detection(hook_repo, hook_repo_head):
     """Test ORIG_HEAD based amend detection."""
-    import os
-
-    # Create git repository
-    git_repo = tmp_path / "test_repo"
-    git_repo.mkdir()
-
-    # Setup git repo
-    subprocess.run(["git", "init"], cwd=git_repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"], cwd=git_repo, check=True
-    )
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"], cwd=git_repo, check=True
-    )
+    # Test without ORIG_HEAD (normal case)
+    assert not is_amend_commit("feat: new feature", cwd=hook_repo)
 
-    # Create and commit initial file
-    test_file = git_repo / "test.txt"
-    test_file.write_text("initial")
-    subprocess.run(["git", "add", "test.txt"], cwd=git_repo, check=True)
-    subprocess.run(
-        ["git", "commit", "-m", "feat: initial commit"], cwd=git_repo, check=True
-    )
+    # Simulate ORIG_HEAD existence (manually create it as Git would during amend)
+    orig_head_file = hook_repo / ".git" / "ORIG_HEAD"
 
-    original_cwd = Path.cwd()
-    try:
-        os.chdir(git_repo)
+    # Write current HEAD to ORIG_HEAD (as Git does during amend)
+    orig_head_file.write_text(hook_repo_head)
 
-        # Test without ORIG_HEAD (normal case)
-        assert not is_amend_commit("feat: new feature")
+    # Now it should detect as amend
+    assert is_amend_commit("feat: any message", cwd=hook_repo)
 
-        # Simulate ORIG_HEAD existence (manually create it as Git would during amend)
-        git_dir_result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        git_dir = Path(git_dir_result.stdout.strip())
-        orig_head_file = git_dir / "ORIG_HEAD"
+    # A recent ORIG_HEAD pointing elsewhere is conclusive: not an amend,
+    # even when the message matches HEAD
+    orig_head_file.write_text("0" * 40)
+    assert not is_amend_commit(commit_message="chore: initial commit", cwd=hook_repo)
 
-        # Write current HEAD to ORIG_HEAD (as Git does during amend)
-        head_result = subprocess.run(
-            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
-        )
-        orig_head_file.write_text(head_result.stdout.strip())
-
-        # Now it should detect as amend
-        assert is_amend_commit("feat: any message")
-
-        # Clean up
-        orig_head_file.unlink()
-
-    finally:
-        os.chdir(original_cwd)
+    # Clean up
+    orig_head_file.unlink()